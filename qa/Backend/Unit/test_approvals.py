@@ -0,0 +1,62 @@
+"""
+Tests for the quota approval workflow.
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+
+from app.logic import ApprovalManager
+
+
+@pytest.fixture
+def approval(session, test_user):
+    return ApprovalManager(session).create_request(
+        user=test_user, requested_credits=Decimal("250.00"), reason="Quarter-end batch job"
+    )
+
+
+class TestApprove:
+    """approve() grants a pending request exactly once."""
+
+    def test_approve_credits_requested_amount(self, session, test_user, approval):
+        approver_id = uuid.uuid4()
+        quota_before = test_user.personal_quota
+
+        result = ApprovalManager(session).approve(str(approval.id), str(approver_id))
+
+        assert result.id == approval.id
+        assert result.status == "approved"
+        assert result.approved_by == approver_id
+        assert result.approved_credits == Decimal("250.00")
+        assert result.resolved_at is not None
+        session.refresh(test_user)
+        assert test_user.personal_quota == quota_before + Decimal("250.00")
+
+    def test_approve_with_explicit_amount(self, session, test_user, approval):
+        quota_before = test_user.personal_quota
+
+        result = ApprovalManager(session).approve(
+            str(approval.id), str(uuid.uuid4()), approved_credits=Decimal("100.00")
+        )
+
+        assert result.approved_credits == Decimal("100.00")
+        session.refresh(test_user)
+        assert test_user.personal_quota == quota_before + Decimal("100.00")
+
+    def test_already_approved_is_not_credited_again(self, session, test_user, approval):
+        manager = ApprovalManager(session)
+        manager.approve(str(approval.id), str(uuid.uuid4()))
+        session.refresh(test_user)
+        quota_after_first = test_user.personal_quota
+
+        with pytest.raises(ValueError, match="already resolved"):
+            manager.approve(str(approval.id), str(uuid.uuid4()))
+
+        session.refresh(test_user)
+        assert test_user.personal_quota == quota_after_first
+
+    def test_missing_request(self, session):
+        with pytest.raises(ValueError, match="Invalid workflow ID"):
+            ApprovalManager(session).approve(str(uuid.uuid4()), str(uuid.uuid4()))
@@ -0,0 +1,139 @@
+"""
+Tests for the leaderboard write-behind queue.
+"""
+
+import asyncio
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlmodel import Session, select
+
+from app import leaderboard_writer
+from app.leaderboard_writer import LeaderboardDelta
+from app.models import LeaderboardEntry, RequestLog
+
+
+def _delta(user_id, prompt=100, completion=50, cost="0.50"):
+    return LeaderboardDelta.from_log(
+        RequestLog(
+            user_id=user_id,
+            model="gpt-4",
+            provider="openai",
+            prompt_tokens=prompt,
+            completion_tokens=completion,
+            total_tokens=prompt + completion,
+            cost_credits=Decimal(cost),
+        )
+    )
+
+
+def _entries(engine, user_id):
+    with Session(engine) as session:
+        rows = session.exec(
+            select(LeaderboardEntry).where(LeaderboardEntry.user_id == user_id)
+        ).all()
+    return {row.period_type: row for row in rows}
+
+
+@pytest.fixture
+def writer_queue(monkeypatch):
+    """Stand in for a running writer without starting its loop."""
+    queue = asyncio.Queue(maxsize=2)
+    monkeypatch.setattr(leaderboard_writer, "_queue", queue)
+    return queue
+
+
+class TestSubmit:
+    """accepting() and submit() tell the caller when to update inline."""
+
+    def test_no_writer_running(self, monkeypatch):
+        monkeypatch.setattr(leaderboard_writer, "_queue", None)
+
+        assert leaderboard_writer.accepting() is False
+        assert leaderboard_writer.submit(_delta(uuid.uuid4())) is False
+
+    def test_queues_delta(self, writer_queue):
+        user_id = uuid.uuid4()
+
+        assert leaderboard_writer.accepting() is True
+        assert leaderboard_writer.submit(_delta(user_id)) is True
+        assert writer_queue.get_nowait() == LeaderboardDelta(user_id, 100, 50, Decimal("0.50"))
+
+    def test_queue_full(self, writer_queue):
+        user_id = uuid.uuid4()
+        assert leaderboard_writer.submit(_delta(user_id)) is True
+        assert leaderboard_writer.submit(_delta(user_id)) is True
+
+        # The caller falls back to a synchronous update
+        assert leaderboard_writer.accepting() is False
+        assert leaderboard_writer.submit(_delta(user_id)) is False
+        assert writer_queue.qsize() == 2
+
+
+class TestFlush:
+    """Batches are summed per user and written in one transaction."""
+
+    def test_aggregates_per_user(self, engine, test_user):
+        other_id = uuid.uuid4()
+        leaderboard_writer._flush(
+            [
+                LeaderboardDelta(test_user.id, 100, 50, Decimal("0.50")),
+                LeaderboardDelta(other_id, 10, 10, Decimal("0.10")),
+                LeaderboardDelta(test_user.id, 300, 150, Decimal("1.25")),
+            ]
+        )
+
+        entries = _entries(engine, test_user.id)
+        assert set(entries) == set(leaderboard_writer.PERIOD_TYPES)
+        for entry in entries.values():
+            assert entry.total_requests == 2
+            assert entry.total_prompt_tokens == 400
+            assert entry.total_completion_tokens == 200
+            assert entry.total_cost_credits == Decimal("1.75")
+        assert _entries(engine, other_id)["daily"].total_requests == 1
+
+    def test_failed_flush_counts_dropped_deltas(self, monkeypatch):
+        dropped = []
+
+        class FakeCounter:
+            def inc(self, amount=1):
+                dropped.append(amount)
+
+        def broken_engine():
+            raise RuntimeError("database unavailable")
+
+        monkeypatch.setattr(leaderboard_writer, "leaderboard_deltas_dropped_total", FakeCounter())
+        monkeypatch.setattr(leaderboard_writer.app_database, "get_engine", broken_engine)
+        user_id = uuid.uuid4()
+
+        leaderboard_writer._flush(
+            [
+                LeaderboardDelta(user_id, 1, 1, Decimal("0.01")),
+                LeaderboardDelta(user_id, 1, 1, Decimal("0.01")),
+                LeaderboardDelta(uuid.uuid4(), 1, 1, Decimal("0.01")),
+            ]
+        )
+
+        assert dropped == [3]
+
+
+class TestWriterLoop:
+    """Cancelling the loop flushes whatever is still pending."""
+
+    def test_cancel_flushes_pending_deltas(self, engine, test_user):
+        async def scenario():
+            task = asyncio.create_task(leaderboard_writer.leaderboard_writer_loop())
+            await asyncio.sleep(0)  # let the loop create its queue
+            for _ in range(3):
+                assert leaderboard_writer.submit(_delta(test_user.id)) is True
+            await asyncio.sleep(0)  # first delta taken, the rest still queued
+            task.cancel()
+            await task
+
+        asyncio.run(scenario())
+
+        assert leaderboard_writer._queue is None
+        entries = _entries(engine, test_user.id)
+        assert entries["daily"].total_requests == 3
+        assert entries["monthly"].total_prompt_tokens == 300
@@ -0,0 +1,148 @@
+"""
+Tests for the shared notification primitives.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import pytest
+
+from app.integrations import base
+from app.integrations.base import (
+    AdmissionController,
+    EventType,
+    NotificationEvent,
+    TokenBucket,
+)
+
+
+class TestNotificationEvent:
+    """Derived fields are computed once, at construction."""
+
+    def test_derived_fields(self):
+        event = NotificationEvent(
+            event_type=EventType.QUOTA_WARNING,
+            title="Quota warning",
+            message="80% of quota used",
+            event_id="0123456789abcdef",
+            timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+        )
+
+        assert event.short_id == "01234567"
+        assert event.ts_epoch == 1767225600
+
+    def test_derived_fields_for_defaults(self):
+        event = NotificationEvent(
+            event_type=EventType.QUOTA_WARNING, title="Quota warning", message="80% used"
+        )
+
+        assert event.short_id == event.event_id[:8]
+        assert event.ts_epoch == int(event.timestamp.timestamp())
+
+
+class TestTokenBucket:
+    """Burst up to capacity, then refill at the configured rate."""
+
+    def test_burst_up_to_capacity(self):
+        bucket = TokenBucket(capacity=3, refill_rate=1)
+
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+
+    def test_refill(self):
+        bucket = TokenBucket(capacity=3, refill_rate=10)
+        bucket.tokens = 0
+        bucket.last_refill -= 0.25  # 2.5 tokens' worth of elapsed time
+
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_refill_is_capped_at_capacity(self):
+        bucket = TokenBucket(capacity=2, refill_rate=10)
+        bucket.last_refill -= 60
+
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_waiters_sleep_outside_the_lock(self, monkeypatch):
+        bucket = TokenBucket(capacity=1, refill_rate=10)
+        delays = []
+
+        async def fake_sleep(seconds):
+            assert not bucket._lock.locked()
+            delays.append(seconds)
+
+        monkeypatch.setattr(base.asyncio, "sleep", fake_sleep)
+
+        async def scenario():
+            await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+        asyncio.run(scenario())
+
+        # The first token is free; later waiters queue for successive refills
+        assert delays == [pytest.approx(0.1, abs=0.01), pytest.approx(0.2, abs=0.01)]
+        assert bucket.try_acquire() is False
+
+    def test_cancelled_waiter_returns_its_token(self):
+        bucket = TokenBucket(capacity=1, refill_rate=1)
+
+        async def scenario():
+            await bucket.acquire()
+            waiter = asyncio.create_task(bucket.acquire())
+            await asyncio.sleep(0)  # reserve a token, then sleep for it
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        asyncio.run(scenario())
+
+        assert bucket.tokens == pytest.approx(0, abs=0.1)
+
+
+class TestAdmissionController:
+    """At most ``limit`` holders at once; the limit can change at runtime."""
+
+    def test_limits_concurrency(self):
+        controller = AdmissionController(2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with controller:
+                peak = max(peak, controller.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def scenario():
+            await asyncio.gather(*(work() for _ in range(5)))
+
+        asyncio.run(scenario())
+
+        assert peak == 2
+        assert controller.in_flight == 0
+
+    def test_waiter_admitted_on_release(self):
+        controller = AdmissionController(1)
+
+        async def scenario():
+            await controller.acquire()
+            waiter = asyncio.create_task(controller.acquire())
+            await asyncio.sleep(0.01)
+            blocked = not waiter.done()
+            await controller.release()
+            await asyncio.wait_for(waiter, 1)
+            return blocked
+
+        assert asyncio.run(scenario()) is True
+        assert controller.in_flight == 1
+
+    def test_resize_admits_waiters(self):
+        controller = AdmissionController(1)
+
+        async def scenario():
+            await controller.acquire()
+            waiters = [asyncio.create_task(controller.acquire()) for _ in range(2)]
+            await asyncio.sleep(0.01)
+            blocked = not any(w.done() for w in waiters)
+            await controller.resize(3)
+            await asyncio.wait_for(asyncio.gather(*waiters), 1)
+            return blocked
+
+        assert asyncio.run(scenario()) is True
+        assert controller.in_flight == 3
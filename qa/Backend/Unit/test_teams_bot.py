@@ -0,0 +1,216 @@
+"""
+Tests for the Teams bot router lifecycle.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import jwt
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from app import main
+from app.integrations import teams_bot
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Isolate the router registry and record the bot's background work."""
+    recorded = []
+
+    async def warm_up(self):
+        recorded.append("warm_up")
+
+    async def token_refresher(self):
+        recorded.append("token_refresher")
+
+    async def close(self):
+        recorded.append("close")
+
+    async def refresh_signing_keys():
+        recorded.append("jwks")
+
+    monkeypatch.setattr(teams_bot, "_ROUTER_LIFECYCLES", [])
+    monkeypatch.setitem(teams_bot.TEAMS_CONFIG, "app_id", "app-id")
+    monkeypatch.setitem(teams_bot.TEAMS_CONFIG, "app_password", "app-password")
+    monkeypatch.setattr(teams_bot.TeamsBot, "_warm_up", warm_up)
+    monkeypatch.setattr(teams_bot.TeamsBot, "_token_refresher", token_refresher)
+    monkeypatch.setattr(teams_bot.TeamsBot, "close", close)
+    monkeypatch.setattr(teams_bot, "refresh_signing_keys", refresh_signing_keys)
+    return recorded
+
+
+async def _run_lifespan():
+    teams_bot.create_teams_router()
+    await teams_bot.start_teams_routers()
+    await asyncio.sleep(0.01)  # let the background tasks take their first step
+    await teams_bot.stop_teams_routers()
+
+
+class TestTeamsRouterLifecycle:
+    """The app lifespan, not router hooks, drives the bot's background tasks."""
+
+    def test_start_runs_token_refresher_and_stop_closes_bot(self, calls):
+        asyncio.run(_run_lifespan())
+
+        assert "token_refresher" in calls
+        assert calls[-1] == "close"
+
+    def test_webhook_starts_bot_lazily(self, calls):
+        app = FastAPI()
+        app.include_router(teams_bot.create_teams_router())
+
+        async def scenario():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/integrations/teams/webhook", json={})
+            await asyncio.sleep(0.01)
+            await teams_bot.stop_teams_routers()
+            return response
+
+        response = asyncio.run(scenario())
+
+        # Rejected for the missing token, but the bot was started first
+        assert response.status_code == 401
+        assert "token_refresher" in calls
+
+    def test_start_warms_up_bot(self, calls):
+        asyncio.run(_run_lifespan())
+
+        assert "warm_up" in calls
+
+    def test_start_runs_signing_key_refresher(self, calls):
+        asyncio.run(_run_lifespan())
+
+        assert "jwks" in calls
+
+
+def _post_webhook(app):
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.post("/integrations/teams/webhook", json={})
+        await teams_bot.stop_teams_routers()
+        return response.status_code
+
+    return asyncio.run(scenario())
+
+
+class TestRouterRegistration:
+    """The app mounts the webhook only when Bot Framework credentials are set."""
+
+    def test_mounted_when_configured(self, calls):
+        app = FastAPI()
+        main.register_routers(app)
+
+        assert len(teams_bot._ROUTER_LIFECYCLES) == 1
+        # Rejected for the missing token, so the route exists
+        assert _post_webhook(app) == 401
+
+    def test_not_mounted_without_credentials(self, calls, monkeypatch):
+        monkeypatch.setitem(teams_bot.TEAMS_CONFIG, "app_password", "")
+        app = FastAPI()
+        main.register_routers(app)
+
+        assert teams_bot._ROUTER_LIFECYCLES == []
+        assert _post_webhook(app) == 404
+
+
+class TestTokenRefresher:
+    """Failed renewals are logged and retried with a growing delay."""
+
+    def test_failures_back_off_and_success_resets(self, monkeypatch, caplog):
+        bot = teams_bot.TeamsBot("app-id", "app-password", "http://alfred.test")
+        outcomes = iter([False, False, False, True, False])
+        delays = []
+
+        async def fetch_token():
+            if not next(outcomes):
+                raise httpx.ConnectError("login unavailable")
+            bot._token_deadline = teams_bot.time.monotonic() + 3600
+            return "token"
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+            if len(delays) == 5:
+                raise asyncio.CancelledError
+
+        monkeypatch.setattr(bot, "_fetch_token", fetch_token)
+        monkeypatch.setattr(teams_bot.asyncio, "sleep", fake_sleep)
+        monkeypatch.setattr(teams_bot, "TOKEN_RETRY_MAX", 100)
+
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(bot._token_refresher())
+
+        # Renewed 5 minutes before the one-hour expiry
+        assert delays[:3] == [30, 60, 100]
+        assert delays[3] == pytest.approx(3300, abs=5)
+        assert delays[4] == 30
+        failures = [r for r in caplog.records if "token refresh failed" in r.message]
+        assert len(failures) == 4
+        assert all(r.exc_info for r in failures)
+
+
+@pytest.fixture
+def jwks(monkeypatch):
+    """Serve a one-key JWKS and count how often it is fetched."""
+    fetches = []
+
+    class FakeJWKSClient:
+        def get_signing_keys(self, refresh=False):
+            fetches.append(refresh)
+            return [SimpleNamespace(key_id="known", key="public-key")]
+
+    monkeypatch.setattr(teams_bot, "_JWKS_CLIENT", FakeJWKSClient())
+    monkeypatch.setattr(teams_bot, "_SIGNING_KEYS", {})
+    monkeypatch.setattr(teams_bot, "_SIGNING_KEYS_LOCK", asyncio.Lock())
+    monkeypatch.setattr(teams_bot, "_signing_keys_fetched_at", float("-inf"))
+    return fetches
+
+
+class TestSigningKeys:
+    """Only keys served by the JWKS endpoint are cached; refetches are rate-limited."""
+
+    def test_unknown_kid_is_never_cached(self, jwks):
+        async def scenario():
+            return [await teams_bot._get_signing_key(kid) for kid in ("forged-1", "forged-2")]
+
+        assert asyncio.run(scenario()) == [None, None]
+        assert teams_bot._SIGNING_KEYS == {"known": "public-key"}
+        # The second unknown kid arrived within the refetch interval
+        assert len(jwks) == 1
+
+    def test_known_kid_is_served_from_cache(self, jwks):
+        async def scenario():
+            await teams_bot.refresh_signing_keys()
+            return await teams_bot._get_signing_key("known")
+
+        assert asyncio.run(scenario()) == "public-key"
+        assert len(jwks) == 1
+
+    def test_unknown_kid_refetches_after_interval(self, jwks, monkeypatch):
+        async def scenario():
+            await teams_bot._get_signing_key("forged")
+            monkeypatch.setattr(
+                teams_bot,
+                "_signing_keys_fetched_at",
+                teams_bot.time.monotonic() - teams_bot.JWKS_MIN_REFETCH_INTERVAL,
+            )
+            await teams_bot._get_signing_key("forged")
+
+        asyncio.run(scenario())
+
+        assert len(jwks) == 2
+
+    def test_unknown_kid_is_rejected(self, jwks):
+        # Signed with an attacker's key; rejected before the signature check
+        token = jwt.encode(
+            {"serviceurl": "https://smba.test"}, "x" * 32, headers={"kid": "forged"}
+        )
+
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(teams_bot.validate_bot_framework_jwt(f"Bearer {token}"))
+
+        assert excinfo.value.status_code == 401
+        assert excinfo.value.detail == "Unknown token signing key"
@@ -0,0 +1,94 @@
+"""
+Tests for the settlement transaction scope (UnitOfWork).
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import select
+
+from app.logic import EfficiencyScorer, QuotaManager, RequestLogger, UnitOfWork
+from app.models import ChatCompletionRequest, ChatMessage, LeaderboardEntry, RequestLog
+
+RESPONSE = {
+    "usage": {"prompt_tokens": 100, "completion_tokens": 50, "total_tokens": 150},
+    "choices": [{"message": {"content": "Hello"}}],
+}
+
+
+@pytest.fixture
+def commits(session):
+    """Count the transactions actually committed on the session."""
+    counter = []
+    event.listen(session, "after_commit", lambda s: counter.append(s))
+    return counter
+
+
+def _settle(session, user):
+    """The proxy's three ledger writes: quota, request log, leaderboard."""
+    QuotaManager(session).deduct_quota(user, Decimal("5.00"), source="personal")
+    log = RequestLogger(session).log_request(
+        user=user,
+        request=ChatCompletionRequest(
+            model="gpt-4", messages=[ChatMessage(role="user", content="Hi")]
+        ),
+        response=RESPONSE,
+        cost_credits=Decimal("5.00"),
+        quota_source="personal",
+        strict_privacy=False,
+        latency_ms=120,
+    )
+    EfficiencyScorer(session).update_leaderboard(user, log, period_type="daily")
+
+
+def _request_logs(session, user):
+    return session.exec(select(RequestLog).where(RequestLog.user_id == user.id)).all()
+
+
+def _leaderboard(session, user):
+    return session.exec(
+        select(LeaderboardEntry).where(LeaderboardEntry.user_id == user.id)
+    ).all()
+
+
+class TestUnitOfWork:
+    """Writes inside the block land or roll back together."""
+
+    def test_commits_all_writes_once(self, session, test_user, commits):
+        used_before = test_user.used_tokens
+
+        with UnitOfWork(session):
+            _settle(session, test_user)
+
+        assert len(commits) == 1
+        session.refresh(test_user)
+        assert test_user.used_tokens == used_before + Decimal("5.00")
+        assert len(_request_logs(session, test_user)) == 1
+        assert len(_leaderboard(session, test_user)) == 1
+
+    def test_failure_rolls_back_all_writes(self, session, test_user, commits):
+        used_before = test_user.used_tokens
+
+        with pytest.raises(RuntimeError):
+            with UnitOfWork(session):
+                _settle(session, test_user)
+                raise RuntimeError("provider response could not be settled")
+
+        assert commits == []
+        session.refresh(test_user)
+        assert test_user.used_tokens == used_before
+        assert _request_logs(session, test_user) == []
+        assert _leaderboard(session, test_user) == []
+
+    def test_nested_blocks_commit_once(self, session, test_user, commits):
+        with UnitOfWork(session):
+            with UnitOfWork(session):
+                _settle(session, test_user)
+            # The inner block deferred to the outer one
+            assert commits == []
+            _settle(session, test_user)
+
+        assert len(commits) == 1
+        assert len(_request_logs(session, test_user)) == 2
+        assert _leaderboard(session, test_user)[0].total_requests == 2
@@ -0,0 +1,229 @@
+"""
+Tests for webhook delivery retries and the dead-letter queue.
+"""
+
+import asyncio
+import json
+
+import httpx
+
+from app.integrations import webhook
+from app.integrations.base import EventType, NotificationEvent
+from app.integrations.manager import NotificationManager, setup_notifications
+from app.integrations.webhook import WebhookDeadLetterQueue, WebhookNotifier
+
+
+def _notifier(handler, **kwargs):
+    notifier = WebhookNotifier(
+        url="https://hooks.example.com/alfred",
+        max_backoff=0,  # retry immediately
+        **kwargs,
+    )
+    notifier._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return notifier
+
+
+def _event():
+    return NotificationEvent(
+        event_type=EventType.QUOTA_WARNING,
+        title="Quota warning",
+        message="80% of quota used",
+    )
+
+
+async def _send_and_close(notifier, event):
+    try:
+        return await notifier.send(event)
+    finally:
+        await notifier.close()
+
+
+class TestWebhookDeadLetter:
+    """Events that exhaust their retries are parked and replayed later."""
+
+    def test_parks_event_after_retries_exhausted(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(503, text="unavailable")
+
+        dlq = WebhookDeadLetterQueue()
+        event = _event()
+        delivered = asyncio.run(
+            _send_and_close(_notifier(handler, max_retries=3, dead_letter=dlq), event)
+        )
+
+        assert delivered is False
+        assert len(attempts) == 3
+        parked = asyncio.run(dlq.drain())
+        assert len(parked) == 1
+        assert parked[0]["event_id"] == event.event_id
+        assert parked[0]["replays"] == 0
+        assert parked[0]["error"].startswith("HTTP 503")
+        assert json.loads(parked[0]["payload"])["title"] == "Quota warning"
+
+    def test_replay_delivers_parked_event(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.content)
+            return httpx.Response(200)
+
+        dlq = WebhookDeadLetterQueue()
+        payload = '{"event_id":"evt-1","source":"alfred"}'
+        notifier = _notifier(handler, secret="s3cret", dead_letter=dlq)
+
+        async def scenario():
+            await dlq.enqueue(
+                {
+                    "event_id": "evt-1",
+                    "event_type": EventType.QUOTA_WARNING.value,
+                    "payload": payload,
+                    "error": "HTTP 503: unavailable",
+                    "replays": 0,
+                }
+            )
+            try:
+                return await notifier.replay_dead_letters()
+            finally:
+                await notifier.close()
+
+        assert asyncio.run(scenario()) == 1
+        # The exact parked body is re-posted, and the queue is empty again
+        assert bodies == [payload.encode("utf-8")]
+        assert asyncio.run(dlq.drain()) == []
+
+    def test_replay_reparks_until_max_replays(self):
+        dlq = WebhookDeadLetterQueue(max_replays=2)
+        notifier = _notifier(
+            lambda request: httpx.Response(503), max_retries=1, dead_letter=dlq
+        )
+        entry = {
+            "event_id": "evt-1",
+            "event_type": EventType.QUOTA_WARNING.value,
+            "payload": "{}",
+            "error": None,
+            "replays": 0,
+        }
+
+        async def scenario():
+            await dlq.enqueue(entry)
+            await notifier.replay_dead_letters()
+            reparked = list(dlq._memory_store)
+            await notifier.replay_dead_letters()
+            await notifier.close()
+            return reparked
+
+        reparked = asyncio.run(scenario())
+
+        assert [e["replays"] for e in reparked] == [1]
+        # Second failure reaches max_replays and the entry is dropped
+        assert asyncio.run(dlq.drain()) == []
+
+
+class TestWebhookReplayLoop:
+    """start() replays parked events in the background until close()."""
+
+    def test_start_replays_until_closed(self):
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.content)
+            return httpx.Response(200)
+
+        dlq = WebhookDeadLetterQueue()
+        notifier = _notifier(handler, dead_letter=dlq, dead_letter_interval=0)
+
+        async def scenario():
+            await dlq.enqueue(
+                {
+                    "event_id": "evt-1",
+                    "event_type": EventType.QUOTA_WARNING.value,
+                    "payload": "{}",
+                    "error": None,
+                    "replays": 0,
+                }
+            )
+            notifier.start()
+            task = notifier._replay_task
+            for _ in range(100):
+                if bodies:
+                    break
+                await asyncio.sleep(0.01)
+            await notifier.close()
+            return task
+
+        task = asyncio.run(scenario())
+
+        assert bodies == [b"{}"]
+        assert task.cancelled()
+
+    def test_start_without_dead_letter_queue(self):
+        notifier = _notifier(lambda request: httpx.Response(200))
+
+        async def scenario():
+            notifier.start()
+            await notifier.close()
+
+        asyncio.run(scenario())
+
+        assert notifier._replay_task is None
+
+
+class TestWebhookRetries:
+    """Retry policy of a single delivery."""
+
+    def test_client_error_is_not_retried_or_parked(self):
+        attempts = []
+
+        def handler(request):
+            attempts.append(request)
+            return httpx.Response(400, text="bad request")
+
+        dlq = WebhookDeadLetterQueue()
+        delivered = asyncio.run(
+            _send_and_close(_notifier(handler, max_retries=3, dead_letter=dlq), _event())
+        )
+
+        assert delivered is False
+        assert len(attempts) == 1
+        assert asyncio.run(dlq.drain()) == []
+
+    def test_retry_after_sets_the_delay(self, monkeypatch):
+        delays = []
+
+        async def fake_sleep(seconds):
+            delays.append(seconds)
+
+        monkeypatch.setattr(webhook.asyncio, "sleep", fake_sleep)
+        responses = iter(
+            [httpx.Response(429, headers={"Retry-After": "7"}), httpx.Response(200)]
+        )
+        notifier = _notifier(lambda request: next(responses), max_retries=3)
+
+        assert asyncio.run(_send_and_close(notifier, _event())) is True
+        assert delays == [7.0]
+
+
+class TestSetupNotifications:
+    """A configured webhook URL registers a notifier with its dead-letter queue."""
+
+    def test_registers_webhook_notifier(self, monkeypatch):
+        manager = NotificationManager()
+        monkeypatch.setattr(
+            "app.integrations.manager.get_notification_manager", lambda: manager
+        )
+        dlq = WebhookDeadLetterQueue()
+
+        setup_notifications(
+            webhook_url="https://hooks.example.com/alfred",
+            webhook_secret="s3cret",
+            webhook_dead_letter=dlq,
+        )
+
+        [notifier] = manager.providers
+        assert isinstance(notifier, WebhookNotifier)
+        assert notifier.is_configured
+        assert notifier._dead_letter is dlq
+        asyncio.run(notifier.close())
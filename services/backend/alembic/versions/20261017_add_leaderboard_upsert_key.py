@@ -0,0 +1,72 @@
+"""
+Alembic migration: unique bucket key on leaderboard
+
+Adds a unique index on (user_id, period_type, period_start), used as the
+ON CONFLICT target by the leaderboard upsert. Buckets that the old
+read-modify-write path duplicated are folded into a single row first.
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_add_leaderboard_upsert_key"
+down_revision = "20260216_add_team_member_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _merge_duplicate_buckets() -> None:
+    bind = op.get_bind()
+    groups = bind.execute(
+        sa.text(
+            "SELECT user_id, period_type, period_start FROM leaderboard "
+            "GROUP BY user_id, period_type, period_start HAVING COUNT(*) > 1"
+        )
+    ).fetchall()
+    for user_id, period_type, period_start in groups:
+        key = {"user_id": user_id, "period_type": period_type, "period_start": period_start}
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, total_requests, total_prompt_tokens, total_completion_tokens, "
+                "total_cost_credits FROM leaderboard WHERE user_id = :user_id "
+                "AND period_type = :period_type AND period_start = :period_start "
+                "ORDER BY updated_at DESC"
+            ),
+            key,
+        ).fetchall()
+        keep, *extra = rows
+        prompt = sum(r.total_prompt_tokens for r in rows)
+        completion = sum(r.total_completion_tokens for r in rows)
+        bind.execute(
+            sa.text(
+                "UPDATE leaderboard SET total_requests = :requests, "
+                "total_prompt_tokens = :prompt, total_completion_tokens = :completion, "
+                "total_cost_credits = :cost, avg_efficiency_score = :score WHERE id = :id"
+            ),
+            {
+                "id": keep.id,
+                "requests": sum(r.total_requests for r in rows),
+                "prompt": prompt,
+                "completion": completion,
+                "cost": sum(r.total_cost_credits for r in rows),
+                "score": completion / prompt if prompt else 0,
+            },
+        )
+        for row in extra:
+            bind.execute(sa.text("DELETE FROM leaderboard WHERE id = :id"), {"id": row.id})
+
+
+def upgrade() -> None:
+    _merge_duplicate_buckets()
+    op.create_index(
+        "ux_leaderboard_user_period",
+        "leaderboard",
+        ["user_id", "period_type", "period_start"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ux_leaderboard_user_period", table_name="leaderboard")
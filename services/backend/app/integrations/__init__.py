@@ -44,7 +44,7 @@ from .teams import TeamsNotifier
 from .telegram import TelegramNotifier
 from .whatsapp import WhatsAppNotifier
 from .email import EmailNotifier, create_email_notifier
-from .webhook import WebhookNotifier, create_webhook_notifier
+from .webhook import WebhookDeadLetterQueue, WebhookNotifier, create_webhook_notifier
 from .escalation import (
     AlertDeduplicator,
     EscalationLadder,
@@ -82,6 +82,7 @@ __all__ = [
     "WhatsAppNotifier",
     "EmailNotifier",
     "create_email_notifier",
+    "WebhookDeadLetterQueue",
     "WebhookNotifier",
     "create_webhook_notifier",
     "AlertDeduplicator",
@@ -3,6 +3,8 @@ Alfred Notification Base Classes
 Abstract interfaces for notification providers.
 """
 
+import asyncio
+import time
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -42,7 +44,7 @@ class EventType(str, Enum):
     HIGH_LATENCY = "high_latency"  # API latency above threshold
 
 
-@dataclass
+@dataclass(slots=True)
 class NotificationEvent:
     """
     Represents a notification event to be sent to providers.
@@ -60,6 +62,11 @@ class NotificationEvent:
         severity: Event severity (info, warning, error, critical)
         timestamp: When the event occurred
         event_id: Unique event identifier
+        short_id: First 8 characters of event_id (derived)
+        ts_epoch: Integer Unix timestamp (derived)
+
+    The derived fields are computed once at construction, so events are
+    treated as immutable once created.
     """
 
     event_type: EventType
@@ -74,6 +81,13 @@ class NotificationEvent:
     severity: str = "info"  # info, warning, error, critical
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    short_id: str = field(init=False, repr=False, compare=False)
+    ts_epoch: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Derived once here rather than in every provider's payload builder
+        self.short_id = self.event_id[:8]
+        self.ts_epoch = int(self.timestamp.timestamp())
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary."""
@@ -187,3 +201,102 @@ class NotificationResult:
     def __repr__(self) -> str:
         status = "OK" if self.success else f"FAILED: {self.error}"
         return f"NotificationResult({self.provider}, {self.event_id}, {status})"
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Parse a Retry-After header given in seconds, capped at one minute."""
+    try:
+        return min(max(float(value), 0.0), 60.0) if value else default
+    except ValueError:
+        return default
+
+
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+
+    Tokens refill continuously at ``refill_rate`` per second up to ``capacity``.
+    ``acquire`` consumes one token, sleeping until one is available. Each
+    waiter reserves its token under the lock (the balance goes negative while
+    tokens are owed) and sleeps outside it, so waiters are served in arrival
+    order without queueing behind each other's sleeps. ``try_acquire`` is the
+    non-blocking variant for callers that would rather drop work than wait.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+        )
+        self.last_refill = now
+
+    async def acquire(self) -> None:
+        """Wait for and consume a single token."""
+        async with self._lock:
+            self._refill()
+            self.tokens -= 1
+            wait = -self.tokens / self.refill_rate
+        if wait <= 0:
+            return
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # Hand the reserved token back to the bucket
+            self.tokens = min(self.capacity, self.tokens + 1)
+            raise
+
+    def try_acquire(self) -> bool:
+        """Consume a token if one is available right now, without waiting."""
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class AdmissionController:
+    """
+    Resizable concurrency limiter.
+
+    Tracks in-flight work with a plain counter guarded by an
+    ``asyncio.Condition``. Unlike ``asyncio.Semaphore``, the limit can be
+    changed safely at runtime with ``resize``. Use as
+    ``async with controller: ...``.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """Return a slot and wake one waiter."""
+        async with self._cond:
+            self.in_flight -= 1
+            self._cond.notify(1)
+
+    async def resize(self, limit: int) -> None:
+        """Change the limit; waiters are re-checked against the new value."""
+        async with self._cond:
+            self.limit = limit
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.release()
@@ -17,6 +17,7 @@ from .base import (
 from .slack import create_slack_notifier
 from .teams import create_teams_notifier
 from .telegram import create_telegram_notifier
+from .webhook import WebhookDeadLetterQueue, create_webhook_notifier
 
 logger = logging.getLogger(__name__)
 
@@ -327,6 +328,9 @@ def setup_notifications(
     whatsapp_recipient_number: Optional[str] = None,
     whatsapp_alerts_recipient_number: Optional[str] = None,
     whatsapp_template_name: Optional[str] = None,
+    webhook_url: Optional[str] = None,
+    webhook_secret: Optional[str] = None,
+    webhook_dead_letter: Optional[WebhookDeadLetterQueue] = None,
 ) -> NotificationManager:
     """
     Setup notification manager with providers from configuration.
@@ -345,6 +349,9 @@ def setup_notifications(
         whatsapp_recipient_number: Default recipient phone number
         whatsapp_alerts_recipient_number: Separate number for critical alerts
         whatsapp_template_name: Pre-approved template name
+        webhook_url: Generic outbound webhook endpoint
+        webhook_secret: HMAC secret for signing webhook payloads
+        webhook_dead_letter: Where undeliverable webhook events are parked
 
     Returns:
         Configured NotificationManager instance
@@ -377,6 +384,16 @@ def setup_notifications(
     if telegram_notifier:
         manager.add_provider(telegram_notifier)
 
+    # Setup generic webhook
+    if webhook_url:
+        manager.add_provider(
+            create_webhook_notifier(
+                url=webhook_url,
+                secret=webhook_secret,
+                dead_letter=webhook_dead_letter,
+            )
+        )
+
     # Setup WhatsApp
     # whatsapp_notifier = create_whatsapp_notifier(
     #     phone_number_id=whatsapp_phone_number_id,
@@ -10,18 +10,29 @@ Suitability: L2 — Standard Bot Framework patterns.
 ──────────────────────────────────────────────────────────────
 """
 
+import asyncio
+import hashlib
+import logging
 import os
 import json
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+import re
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Dict, Any, Awaitable, Callable, List, Tuple
+from datetime import datetime, timezone
 from enum import Enum
 
 import httpx
 import jwt
 from jwt import PyJWKClient
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from fastapi import HTTPException
 
+from .base import TokenBucket
+
+logger = logging.getLogger(__name__)
+
 # ============================================================
 # Configuration
 # ============================================================
@@ -33,15 +44,109 @@ TEAMS_CONFIG = {
     "alfred_api_url": os.environ.get("ALFRED_API_URL", "http://localhost:8000"),
 }
 
+# Rate limits, kept under the Bot Framework's per-bot and per-conversation
+# throttling thresholds so bursts are smoothed here instead of 429'd by Teams
+BOT_SEND_LIMIT = (50, 50 / 30)          # (burst, tokens/sec) across all conversations
+CONVERSATION_SEND_LIMIT = (1, 1.0)      # per conversation
+INBOUND_USER_LIMIT = (5, 1.0)           # per (conversation, user); excess is dropped
+RATE_LIMIT_MAX_KEYS = 1024              # LRU bound on per-key buckets
+
+# Inbound activities are acknowledged immediately and handled by a small
+# worker pool; the queue bound caps memory when handling falls behind
+INBOUND_QUEUE_SIZE = 1000
+INBOUND_WORKERS = 8
+
+# Background token renewal retries a failing login endpoint with doubling
+# delays, from TOKEN_RETRY_INITIAL up to TOKEN_RETRY_MAX seconds
+TOKEN_RETRY_INITIAL = 30
+TOKEN_RETRY_MAX = 600
+
 # Bot Framework OpenID metadata URL for JWT validation
 BOT_FRAMEWORK_OPENID_METADATA = "https://login.botframework.com/v1/.well-known/openidconfiguration"
 BOT_FRAMEWORK_JWKS_URL = "https://login.botframework.com/v1/.well-known/keys"
 
+# Bot Framework signing keys rotate on the order of days, so a single JWKS
+# client (which caches the key set for an hour) serves every request.
+_JWKS_CLIENT = PyJWKClient(BOT_FRAMEWORK_JWKS_URL, cache_keys=True, lifespan=3600)
+JWKS_REFRESH_INTERVAL = 24 * 3600  # seconds between full key-set reloads
+JWKS_MIN_REFETCH_INTERVAL = 60  # seconds; floor on reloads forced by unknown kids
+
 
 # ============================================================
 # Security: JWT Validation
 # ============================================================
 
+# Fixed-message rejections as (status, detail). Each raise gets a fresh
+# HTTPException from _reject(), since a shared instance raised by concurrent
+# requests would have its traceback overwritten by each of them.
+_EXC_MISSING_HEADER = (401, "Missing Authorization header")
+_EXC_BAD_HEADER = (401, "Invalid Authorization header format")
+_EXC_MISSING_SERVICEURL = (401, "Missing serviceurl in token")
+_EXC_EXPIRED = (401, "Token has expired")
+_EXC_AUDIENCE = (401, "Invalid token audience")
+_EXC_ISSUER = (401, "Invalid token issuer")
+_EXC_UNKNOWN_KEY = (401, "Unknown token signing key")
+
+
+def _reject(rejection: Tuple[int, str]) -> HTTPException:
+    """Build the HTTPException for a fixed rejection."""
+    status_code, detail = rejection
+    return HTTPException(status_code=status_code, detail=detail)
+
+
+# Public keys by ``kid``, holding exactly the key set the JWKS endpoint last
+# returned; the kid a token asks for is never stored. The key set is fetched
+# off the event loop (the JWKS client does blocking I/O) under a lock, so a
+# burst of tokens carrying a new kid triggers one fetch, and unknown kids
+# force a refetch at most once per JWKS_MIN_REFETCH_INTERVAL.
+_SIGNING_KEYS: Dict[str, Any] = {}
+_SIGNING_KEYS_LOCK = asyncio.Lock()
+_signing_keys_fetched_at = float("-inf")  # time.monotonic() of the last fetch
+
+
+async def _load_signing_keys() -> None:
+    """Replace the cached keys with a fresh key set. Callers hold the lock."""
+    global _signing_keys_fetched_at
+    keys = await asyncio.to_thread(_JWKS_CLIENT.get_signing_keys, True)
+    _signing_keys_fetched_at = time.monotonic()
+    _SIGNING_KEYS.clear()
+    _SIGNING_KEYS.update((k.key_id, k.key) for k in keys)
+
+
+async def _get_signing_key(kid: Optional[str]) -> Optional[Any]:
+    """Resolve the public key for a JWT ``kid``, or None if Microsoft has no such key."""
+    key = _SIGNING_KEYS.get(kid)
+    if key is not None:
+        return key
+    async with _SIGNING_KEYS_LOCK:
+        key = _SIGNING_KEYS.get(kid)
+        if key is None and (
+            time.monotonic() - _signing_keys_fetched_at >= JWKS_MIN_REFETCH_INTERVAL
+        ):
+            # Possibly a freshly rotated key: reload the set once
+            await _load_signing_keys()
+            key = _SIGNING_KEYS.get(kid)
+        return key
+
+
+async def refresh_signing_keys() -> None:
+    """Reload the full key set, dropping keys Microsoft has rotated out."""
+    async with _SIGNING_KEYS_LOCK:
+        await _load_signing_keys()
+
+
+async def _signing_key_refresher() -> None:
+    """Preload the key set, then reload it every JWKS_REFRESH_INTERVAL."""
+    while True:
+        try:
+            await refresh_signing_keys()
+            delay = JWKS_REFRESH_INTERVAL
+        except Exception as e:
+            logger.warning("Bot Framework JWKS refresh failed: %s", e)
+            delay = 60
+        await asyncio.sleep(delay)
+
+
 async def validate_bot_framework_jwt(authorization_header: Optional[str]) -> bool:
     """
     Validate JWT token from Bot Framework against Microsoft's public keys.
@@ -56,22 +161,24 @@ async def validate_bot_framework_jwt(authorization_header: Optional[str]) -> boo
         True if valid, raises HTTPException if invalid
     """
     if not authorization_header:
-        raise HTTPException(status_code=401, detail="Missing Authorization header")
+        raise _reject(_EXC_MISSING_HEADER) from None
     
     if not authorization_header.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Invalid Authorization header format")
+        raise _reject(_EXC_BAD_HEADER) from None
     
-    token = authorization_header.replace("Bearer ", "")
+    token = authorization_header[len("Bearer "):].lstrip()
     
     try:
-        # Get signing keys from Microsoft
-        jwks_client = PyJWKClient(BOT_FRAMEWORK_JWKS_URL)
-        signing_key = jwks_client.get_signing_key_from_jwt(token)
+        # Resolve the signing key from the cached Microsoft key set
+        kid = jwt.get_unverified_header(token).get("kid")
+        signing_key = await _get_signing_key(kid)
+        if signing_key is None:
+            raise _reject(_EXC_UNKNOWN_KEY) from None
         
         # Validate JWT
         decoded = jwt.decode(
             token,
-            signing_key.key,
+            signing_key,
             algorithms=["RS256"],
             audience=TEAMS_CONFIG["app_id"],  # Audience must match our app ID
             issuer="https://api.botframework.com",  # Issuer must be Bot Framework
@@ -85,16 +192,18 @@ async def validate_bot_framework_jwt(authorization_header: Optional[str]) -> boo
         
         # Additional validation: service URL must be present
         if not decoded.get("serviceurl"):
-            raise HTTPException(status_code=401, detail="Missing serviceurl in token")
+            raise _reject(_EXC_MISSING_SERVICEURL) from None
         
         return True
         
+    except HTTPException:
+        raise
     except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token has expired")
+        raise _reject(_EXC_EXPIRED) from None
     except jwt.InvalidAudienceError:
-        raise HTTPException(status_code=401, detail="Invalid token audience")
+        raise _reject(_EXC_AUDIENCE) from None
     except jwt.InvalidIssuerError:
-        raise HTTPException(status_code=401, detail="Invalid token issuer")
+        raise _reject(_EXC_ISSUER) from None
     except jwt.InvalidTokenError as e:
         raise HTTPException(status_code=401, detail=f"Invalid token: {str(e)}")
     except Exception as e:
@@ -133,6 +242,7 @@ class TeamsActivity(BaseModel):
     from_user: Dict[str, Any] = Field(alias="from")
     text: Optional[str] = None
     value: Optional[Dict[str, Any]] = None  # For adaptive card submissions
+    service_url: Optional[str] = Field(default=None, alias="serviceUrl")
 
 
 class CardSubmitData(BaseModel):
@@ -143,10 +253,25 @@ class CardSubmitData(BaseModel):
     reason: Optional[str] = None
 
 
+# Built once: parse and validate raw webhook bytes in a single pass instead of
+# json-decoding first and then re-walking the dict to build the model.
+_TEAMS_ACTIVITY_ADAPTER = TypeAdapter(TeamsActivity)
+_CARD_SUBMIT_ADAPTER = TypeAdapter(CardSubmitData)
+
+
 # ============================================================
 # Adaptive Cards (T202)
 # ============================================================
 
+ADAPTIVE_CARD_SCHEMA = "http://adaptivecards.io/schemas/adaptive-card.json"
+
+
+@lru_cache(maxsize=1)
+def _format_utc_minute(epoch_minute: int) -> str:
+    """Format a UTC minute bucket; cards rendered within the same minute share it."""
+    return f"{datetime.fromtimestamp(epoch_minute * 60, timezone.utc):%Y-%m-%d %H:%M} UTC"
+
+
 class AdaptiveCards:
     """Adaptive card templates for Teams interactions."""
     
@@ -201,7 +326,7 @@ class AdaptiveCards:
                     "url": "${dashboard_url}"
                 }
             ],
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json"
+            "$schema": ADAPTIVE_CARD_SCHEMA
         }
     
     @staticmethod
@@ -209,6 +334,7 @@ class AdaptiveCards:
         """Wallet balance display card."""
         percent_used = min(100, (1 - balance / hard_limit) * 100) if hard_limit > 0 else 0
         status_color = "good" if percent_used < 50 else ("warning" if percent_used < 80 else "attention")
+        last_updated = _format_utc_minute(int(time.time()) // 60)
         
         return {
             "type": "AdaptiveCard",
@@ -243,7 +369,7 @@ class AdaptiveCards:
                 },
                 {
                     "type": "TextBlock",
-                    "text": f"Last updated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}",
+                    "text": f"Last updated: {last_updated}",
                     "size": "Small",
                     "isSubtle": True
                 }
@@ -260,7 +386,7 @@ class AdaptiveCards:
                     "data": {"action": "set_budget_alert"}
                 }
             ],
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json"
+            "$schema": ADAPTIVE_CARD_SCHEMA
         }
     
     @staticmethod
@@ -358,7 +484,7 @@ class AdaptiveCards:
                     }
                 }
             ],
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json"
+            "$schema": ADAPTIVE_CARD_SCHEMA
         }
     
     @staticmethod
@@ -414,7 +540,7 @@ class AdaptiveCards:
                     "data": {"action": "view_usage"}
                 }
             ],
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json"
+            "$schema": ADAPTIVE_CARD_SCHEMA
         }
     
     @staticmethod
@@ -445,7 +571,7 @@ class AdaptiveCards:
                     ]
                 }
             ],
-            "$schema": "http://adaptivecards.io/schemas/adaptive-card.json"
+            "$schema": ADAPTIVE_CARD_SCHEMA
         }
 
 
@@ -453,40 +579,163 @@ class AdaptiveCards:
 # Bot Framework Service (T201)
 # ============================================================
 
+# Chat command keywords -> handler, in precedence order for messages that
+# mention several. "help" and anything unrecognized get the welcome card.
+_COMMAND_HANDLERS = {
+    "balance": "_handle_balance_command",
+    "credit": "_handle_balance_command",
+    "approve": "_handle_approvals_command",
+    "usage": "_handle_usage_command",
+    "analytics": "_handle_usage_command",
+}
+_COMMAND_RANK = {keyword: rank for rank, keyword in enumerate(_COMMAND_HANDLERS)}
+# Substring match, like the ``in`` checks it replaces, but in a single scan
+_COMMAND_RE = re.compile("|".join(_COMMAND_HANDLERS))
+
+def _lru_bucket(
+    buckets: "OrderedDict[Any, TokenBucket]",
+    key: Any,
+    limit: tuple,
+) -> TokenBucket:
+    """Get or create the bucket for ``key``, evicting the least recently used."""
+    bucket = buckets.get(key)
+    if bucket is None:
+        bucket = buckets[key] = TokenBucket(*limit)
+        if len(buckets) > RATE_LIMIT_MAX_KEYS:
+            buckets.popitem(last=False)
+    else:
+        buckets.move_to_end(key)
+    return bucket
+
+
 class TeamsBot:
     """Microsoft Teams bot for Alfred integration."""
     
+    # Seconds a fetched wallet is reused for repeat balance lookups
+    WALLET_CACHE_TTL = 2.0
+    
     def __init__(self, app_id: str, app_password: str, alfred_api_url: str):
         self.app_id = app_id
         self.app_password = app_password
         self.alfred_api_url = alfred_api_url
         self._token: Optional[str] = None
-        self._token_expires: Optional[datetime] = None
+        # time.monotonic() deadline: immune to wall-clock jumps
+        self._token_deadline: float = 0.0
+        self._client: Optional[httpx.AsyncClient] = None
+        self._alfred_client: Optional[httpx.AsyncClient] = None
+        self._token_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
+        self._jwks_task: Optional[asyncio.Task] = None
+        self._wallet_cache: Dict[str, tuple] = {}
+        self._wallet_inflight: Dict[str, asyncio.Task] = {}
+        self._send_bucket = TokenBucket(*BOT_SEND_LIMIT)
+        self._conversation_buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared Bot Framework HTTP client, created lazily inside the running event loop."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32),
+            )
+        return self._client
+    
+    def _get_alfred_client(self) -> httpx.AsyncClient:
+        """Get the pooled client for Alfred API calls made by command handlers."""
+        if self._alfred_client is None or self._alfred_client.is_closed:
+            self._alfred_client = httpx.AsyncClient(
+                base_url=self.alfred_api_url,
+                http2=True,
+                timeout=httpx.Timeout(10.0, connect=3.0),
+                limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=30),
+            )
+        return self._alfred_client
+    
+    async def start(self) -> None:
+        """Warm up connections and start the token and signing-key refreshers."""
+        if self._warm_up_task is None:
+            self._warm_up_task = asyncio.create_task(self._warm_up())
+        if self._jwks_task is None or self._jwks_task.done():
+            self._jwks_task = asyncio.create_task(_signing_key_refresher())
+        if not (self.app_id and self.app_password):
+            return
+        # The refresher's first fetch also opens the login connection, so the
+        # first user message doesn't pay for the token round-trip
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._token_refresher())
+    
+    async def _warm_up(self) -> None:
+        """Open a pooled keep-alive connection to the Alfred API ahead of traffic."""
+        try:
+            await self._get_alfred_client().get("/health", timeout=5.0)
+        except Exception as e:
+            logger.debug("Teams bot warm-up request failed: %s", e)
+    
+    async def close(self) -> None:
+        """Stop the background tasks and close the shared HTTP clients."""
+        for task in (self._warm_up_task, self._jwks_task, self._refresh_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        for client in (self._client, self._alfred_client):
+            if client and not client.is_closed:
+                await client.aclose()
+    
+    async def _token_refresher(self) -> None:
+        """Renew the token 5 minutes before expiry so senders never wait on login."""
+        backoff = TOKEN_RETRY_INITIAL
+        while True:
+            try:
+                async with self._token_lock:
+                    await self._fetch_token()
+                backoff = TOKEN_RETRY_INITIAL
+                delay = self._token_deadline - time.monotonic() - 300
+            except Exception:
+                delay, backoff = backoff, min(backoff * 2, TOKEN_RETRY_MAX)
+                logger.warning(
+                    "Bot Framework token refresh failed; retrying in %ss", delay, exc_info=True
+                )
+            await asyncio.sleep(max(delay, 1))
+    
+    def _token_is_valid(self) -> bool:
+        return bool(self._token) and time.monotonic() < self._token_deadline
     
     async def _get_token(self) -> str:
         """Get OAuth token for Bot Framework."""
-        if self._token and self._token_expires and datetime.utcnow() < self._token_expires:
+        if self._token_is_valid():
             return self._token
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                "https://login.microsoftonline.com/botframework.com/oauth2/v2.0/token",
-                data={
-                    "grant_type": "client_credentials",
-                    "client_id": self.app_id,
-                    "client_secret": self.app_password,
-                    "scope": "https://api.botframework.com/.default"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            self._token = data["access_token"]
-            # Token expires in ~1 hour, refresh at 50 minutes
-            from datetime import timedelta
-            self._token_expires = datetime.utcnow() + timedelta(minutes=50)
-            
-            return self._token
+        # Single-flight: concurrent callers on a cold or expired token share
+        # one login request instead of each posting to the token endpoint.
+        async with self._token_lock:
+            if self._token_is_valid():
+                return self._token
+            return await self._fetch_token()
+    
+    async def _fetch_token(self) -> str:
+        """Request a new OAuth token. Callers must hold ``_token_lock``."""
+        client = self._get_client()
+        response = await client.post(
+            "https://login.microsoftonline.com/botframework.com/oauth2/v2.0/token",
+            data={
+                "grant_type": "client_credentials",
+                "client_id": self.app_id,
+                "client_secret": self.app_password,
+                "scope": "https://api.botframework.com/.default"
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        self._token = data["access_token"]
+        # Token expires in ~1 hour, refresh at 50 minutes
+        self._token_deadline = time.monotonic() + 50 * 60
+        
+        return self._token
     
     async def send_activity(
         self,
@@ -495,19 +744,24 @@ class TeamsBot:
         activity: Dict[str, Any],
     ) -> None:
         """Send activity back to Teams."""
+        # Wait for both the conversation's and the bot's send budget
+        await _lru_bucket(
+            self._conversation_buckets, conversation_id, CONVERSATION_SEND_LIMIT
+        ).acquire()
+        await self._send_bucket.acquire()
         token = await self._get_token()
         
-        async with httpx.AsyncClient() as client:
-            url = f"{service_url}/v3/conversations/{conversation_id}/activities"
-            response = await client.post(
-                url,
-                headers={
-                    "Authorization": f"Bearer {token}",
-                    "Content-Type": "application/json"
-                },
-                json=activity
-            )
-            response.raise_for_status()
+        client = self._get_client()
+        url = f"{service_url}/v3/conversations/{conversation_id}/activities"
+        response = await client.post(
+            url,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            },
+            json=activity
+        )
+        response.raise_for_status()
     
     async def send_card(
         self,
@@ -537,21 +791,13 @@ class TeamsBot:
         user_name = activity.from_user.get("name", "there")
         
         # Parse commands
-        if "balance" in text or "credit" in text:
-            return await self._handle_balance_command(user_api_key)
-        
-        elif "approve" in text:
-            return await self._handle_approvals_command(user_api_key)
-        
-        elif "usage" in text or "analytics" in text:
-            return await self._handle_usage_command(user_api_key)
-        
-        elif "help" in text:
-            return AdaptiveCards.welcome_card(user_name)
+        keywords = _COMMAND_RE.findall(text)
+        if keywords:
+            keyword = min(keywords, key=_COMMAND_RANK.__getitem__)
+            return await getattr(self, _COMMAND_HANDLERS[keyword])(user_api_key)
         
-        else:
-            # Default response
-            return AdaptiveCards.welcome_card(user_name)
+        # Help and default response
+        return AdaptiveCards.welcome_card(user_name)
     
     async def handle_card_action(
         self,
@@ -559,7 +805,7 @@ class TeamsBot:
         user_api_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Handle adaptive card action submission."""
-        data = CardSubmitData(**(activity.value or {}))
+        data = _CARD_SUBMIT_ADAPTER.validate_python(activity.value or {})
         
         if data.action == AdaptiveCardAction.CHECK_BALANCE:
             return await self._handle_balance_command(user_api_key)
@@ -593,19 +839,13 @@ class TeamsBot:
             )
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.alfred_api_url}/v1/wallets/me",
-                    headers={"Authorization": f"Bearer {api_key}"}
-                )
-                response.raise_for_status()
-                wallet = response.json()
-                
-                return AdaptiveCards.balance_card(
-                    balance=float(wallet.get("balance", 0)),
-                    soft_limit=float(wallet.get("soft_limit", 0)),
-                    hard_limit=float(wallet.get("hard_limit", 0))
-                )
+            wallet = await self._get_wallet(api_key)
+            
+            return AdaptiveCards.balance_card(
+                balance=float(wallet.get("balance", 0)),
+                soft_limit=float(wallet.get("soft_limit", 0)),
+                hard_limit=float(wallet.get("hard_limit", 0))
+            )
         except Exception as e:
             return AdaptiveCards.confirmation_card(
                 "Error",
@@ -613,6 +853,38 @@ class TeamsBot:
                 success=False
             )
     
+    async def _get_wallet(self, api_key: str) -> Dict[str, Any]:
+        """Get the caller's wallet, coalescing concurrent and back-to-back lookups."""
+        # Key on a digest so raw API keys aren't held as dict keys
+        key = hashlib.sha256(api_key.encode()).hexdigest()[:16]
+        cached = self._wallet_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.WALLET_CACHE_TTL:
+            return cached[1]
+        
+        task = self._wallet_inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch_wallet(api_key))
+            self._wallet_inflight[key] = task
+            task.add_done_callback(lambda t: self._store_wallet(key, t))
+        # Shielded so one caller being cancelled doesn't fail the others
+        return await asyncio.shield(task)
+    
+    def _store_wallet(self, key: str, task: asyncio.Task) -> None:
+        self._wallet_inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        if len(self._wallet_cache) >= 1024:
+            self._wallet_cache.clear()
+        self._wallet_cache[key] = (time.monotonic(), task.result())
+    
+    async def _fetch_wallet(self, api_key: str) -> Dict[str, Any]:
+        response = await self._get_alfred_client().get(
+            "/v1/wallets/me",
+            headers={"Authorization": f"Bearer {api_key}"}
+        )
+        response.raise_for_status()
+        return response.json()
+    
     async def _handle_approvals_command(
         self,
         api_key: Optional[str],
@@ -631,20 +903,19 @@ class TeamsBot:
     ) -> Dict[str, Any]:
         """Handle usage analytics command."""
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.alfred_api_url}/v1/analytics/usage/me",
-                    headers={"Authorization": f"Bearer {api_key}"} if api_key else {}
+            response = await self._get_alfred_client().get(
+                "/v1/analytics/usage/me",
+                headers={"Authorization": f"Bearer {api_key}"} if api_key else {}
+            )
+            
+            if response.status_code == 200:
+                data = response.json()
+                return AdaptiveCards.confirmation_card(
+                    "Usage Summary",
+                    f"Total requests: {data.get('total_requests', 0)}\n"
+                    f"Total cost: ${float(data.get('total_cost', 0)):.2f}",
+                    success=True
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return AdaptiveCards.confirmation_card(
-                        "Usage Summary",
-                        f"Total requests: {data.get('total_requests', 0)}\n"
-                        f"Total cost: ${float(data.get('total_cost', 0)):.2f}",
-                        success=True
-                    )
         except Exception:
             pass
         
@@ -758,43 +1029,106 @@ class TeamsNotificationService:
 # FastAPI Router Integration
 # ============================================================
 
+# (start, stop) coroutines of every router built by create_teams_router().
+# Routers included into an app with a lifespan handler never see their own
+# on_startup/on_shutdown hooks run, so the app lifespan drives these instead.
+_ROUTER_LIFECYCLES: List[Tuple[Callable[[], Awaitable[None]], Callable[[], Awaitable[None]]]] = []
+
+
+async def start_teams_routers() -> None:
+    """Warm up every Teams router's bot and start its workers and refreshers."""
+    for start, _ in _ROUTER_LIFECYCLES:
+        await start()
+
+
+async def stop_teams_routers() -> None:
+    """Stop every Teams router's workers and background tasks and close its clients."""
+    for _, stop in _ROUTER_LIFECYCLES:
+        try:
+            await stop()
+        except Exception as e:
+            logger.warning("Teams router failed to stop cleanly: %s", e)
+
+
 def create_teams_router():
     """Create FastAPI router for Teams webhook endpoint."""
     from fastapi import APIRouter, Request, HTTPException
     
-    router = APIRouter(prefix="/integrations/teams", tags=["MS Teams"])
-    
     bot = TeamsBot(
         app_id=TEAMS_CONFIG["app_id"],
         app_password=TEAMS_CONFIG["app_password"],
         alfred_api_url=TEAMS_CONFIG["alfred_api_url"],
     )
     
+    inbound_buckets: "OrderedDict[tuple, TokenBucket]" = OrderedDict()
+    queue: "asyncio.Queue[TeamsActivity]" = asyncio.Queue(maxsize=INBOUND_QUEUE_SIZE)
+    workers: List[asyncio.Task] = []
+    
+    async def process_activity(activity: TeamsActivity) -> None:
+        if activity.value:
+            # Card action submission
+            response_card = await bot.handle_card_action(activity)
+        else:
+            # Text message
+            response_card = await bot.handle_message(activity)
+        
+        # Send response
+        service_url = activity.service_url or ""
+        conversation_id = activity.conversation.get("id", "")
+        
+        await bot.send_card(service_url, conversation_id, response_card)
+    
+    async def worker() -> None:
+        while True:
+            activity = await queue.get()
+            try:
+                await process_activity(activity)
+            except Exception:
+                logger.exception("Failed to handle Teams activity %s", activity.id)
+            finally:
+                queue.task_done()
+    
+    async def start() -> None:
+        # Run from the app lifespan, and lazily on each webhook call in case
+        # the router is served without it; both steps are idempotent
+        if not workers or all(task.done() for task in workers):
+            workers[:] = [asyncio.create_task(worker()) for _ in range(INBOUND_WORKERS)]
+        await bot.start()
+    
+    async def stop() -> None:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        workers.clear()
+        await bot.close()
+    
+    _ROUTER_LIFECYCLES.append((start, stop))
+    
+    router = APIRouter(prefix="/integrations/teams", tags=["MS Teams"])
+    
     @router.post("/webhook")
     async def teams_webhook(request: Request):
         """Handle incoming Teams webhook messages."""
+        await start()
         try:
             # Validate Bot Framework JWT token (security critical)
             authorization = request.headers.get("Authorization")
             await validate_bot_framework_jwt(authorization)
             
-            body = await request.json()
-            activity = TeamsActivity(**body)
+            activity = _TEAMS_ACTIVITY_ADAPTER.validate_json(await request.body())
             
             # Handle different activity types
             if activity.type == "message":
-                if activity.value:
-                    # Card action submission
-                    response_card = await bot.handle_card_action(activity)
-                else:
-                    # Text message
-                    response_card = await bot.handle_message(activity)
-                
-                # Send response
-                service_url = body.get("serviceUrl", "")
-                conversation_id = activity.conversation.get("id", "")
+                bucket_key = (activity.conversation.get("id", ""), activity.from_user.get("id", ""))
+                if not _lru_bucket(inbound_buckets, bucket_key, INBOUND_USER_LIMIT).try_acquire():
+                    return {"status": "throttled"}
                 
-                await bot.send_card(service_url, conversation_id, response_card)
+                # Acknowledge now; the reply is sent from a worker so Teams
+                # isn't kept waiting on backend calls and the outbound send
+                try:
+                    queue.put_nowait(activity)
+                except asyncio.QueueFull:
+                    raise HTTPException(status_code=503, detail="Bot is busy, retry later")
                 
                 return {"status": "ok"}
             
@@ -805,6 +1139,8 @@ def create_teams_router():
             else:
                 return {"status": "ignored", "type": activity.type}
         
+        except HTTPException:
+            raise
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
     
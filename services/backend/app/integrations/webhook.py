@@ -15,19 +15,116 @@ Alfred Webhook Notification Provider
 Send notifications via configurable HTTP POST webhooks.
 """
 
+import asyncio
 import hashlib
 import hmac
 import json
 import logging
+import random
 import time
-from typing import Any, Dict, List, Optional
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 import httpx
 
-from .base import EventType, NotificationEvent, NotificationProvider
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib encoder.
+    orjson = None
+
+from .base import (
+    AdmissionController,
+    EventType,
+    NotificationEvent,
+    NotificationProvider,
+    parse_retry_after,
+)
 
 logger = logging.getLogger(__name__)
 
+# Statuses worth retrying besides 5xx; any other non-2xx fails fast.
+_RETRYABLE_STATUS = frozenset({408, 425, 429})
+
+
+def _json_default(obj: Any) -> str:
+    """Encode values the JSON encoders don't handle natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """Serialize a payload to compact UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    # Same bytes orjson would produce: no whitespace, non-ASCII left unescaped
+    return json.dumps(
+        payload, default=_json_default, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class WebhookDeadLetterQueue:
+    """
+    Parking lot for webhook deliveries that exhausted their retries.
+
+    Entries hold the exact payload that was sent, so a replay re-signs and
+    re-posts the same body. Redis-backed (one list per key) so parked
+    events survive restarts; falls back to a bounded in-memory deque if
+    Redis is unavailable.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        key: str = "alfred:webhook:dlq",
+        max_entries: int = 1000,
+        max_replays: int = 10,
+    ):
+        """
+        Args:
+            redis_client: Redis async client (aioredis / redis.asyncio).
+            key:          Redis list key.
+            max_entries:  Oldest entries are discarded beyond this many.
+            max_replays:  Replays before an entry is given up on.
+        """
+        self._redis = redis_client
+        self._key = key
+        self._max_entries = max_entries
+        self.max_replays = max_replays
+        # Fallback in-memory store
+        self._memory_store: Deque[Dict[str, Any]] = deque(maxlen=max_entries)
+
+    async def enqueue(self, entry: Dict[str, Any]) -> None:
+        """Park an entry (event_id, event_type, payload, error, replays)."""
+        if self._redis:
+            try:
+                await self._redis.rpush(self._key, json.dumps(entry))
+                await self._redis.ltrim(self._key, -self._max_entries, -1)
+                return
+            except Exception as e:
+                logger.warning(f"webhook_dlq: Redis error ({e}), falling back to memory")
+        self._memory_store.append(entry)
+
+    async def drain(self, limit: int = 100) -> List[Dict[str, Any]]:
+        """Remove and return up to ``limit`` of the oldest entries."""
+        entries: List[Dict[str, Any]] = []
+        if self._redis:
+            try:
+                # LRANGE + LTRIM in one MULTI rather than LPOP with a count,
+                # which needs Redis >= 6.2
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.lrange(self._key, 0, limit - 1)
+                    pipe.ltrim(self._key, limit, -1)
+                    raw, _ = await pipe.execute()
+                entries = [json.loads(item) for item in raw]
+            except Exception as e:
+                logger.warning(f"webhook_dlq: Redis error ({e}), draining memory only")
+        while self._memory_store and len(entries) < limit:
+            entries.append(self._memory_store.popleft())
+        return entries
+
 
 class WebhookNotifier(NotificationProvider):
     """
@@ -35,9 +132,13 @@ class WebhookNotifier(NotificationProvider):
 
     Sends JSON payloads to configurable HTTP endpoints with:
     - HMAC-SHA256 request signing (X-Alfred-Signature header)
-    - Exponential backoff retry (configurable max retries)
+    - Jittered exponential backoff retry (configurable max retries),
+      honoring Retry-After on 429/503; other 4xx responses fail fast
     - Configurable timeout per endpoint
     - Event type filtering per webhook
+    - Bounded concurrent fan-out in send_batch
+    - Optional dead-letter queue: events that exhaust their retries are
+      parked and replayed in the background instead of being dropped
 
     Configuration:
         WEBHOOK_URL:    Target endpoint URL
@@ -53,6 +154,10 @@ class WebhookNotifier(NotificationProvider):
         timeout: float = 10.0,
         event_filter: Optional[List[EventType]] = None,
         webhook_name: str = "default",
+        max_concurrency: int = 16,
+        max_backoff: float = 30.0,
+        dead_letter: Optional[WebhookDeadLetterQueue] = None,
+        dead_letter_interval: float = 60.0,
     ):
         """
         Args:
@@ -64,15 +169,38 @@ class WebhookNotifier(NotificationProvider):
             timeout:      Request timeout in seconds.
             event_filter: If set, only these event types are sent.
             webhook_name: Human label for logging.
+            max_concurrency: Max sends in flight at once from send_batch.
+            max_backoff:  Upper bound in seconds on the pre-jitter backoff.
+            dead_letter:  Where to park events that exhaust their retries.
+            dead_letter_interval: Seconds between dead-letter replay passes.
         """
         self._url = url
         self._secret = secret
+        self._secret_bytes = secret.encode("utf-8") if secret else None
+        # Keyed once; copying it per event skips re-deriving the HMAC pads
+        self._hmac_template = (
+            hmac.new(self._secret_bytes, digestmod=hashlib.sha256) if secret else None
+        )
         self._extra_headers = headers or {}
         self._max_retries = max_retries
+        self._max_backoff = max_backoff
         self._timeout = timeout
         self._event_filter = set(event_filter) if event_filter else None
+        if self._event_filter is not None:
+            # Filter is fixed for the notifier's lifetime, so bind the set
+            # lookup directly; unfiltered notifiers keep the base "accept all"
+            self.supports_event = self._event_filter.__contains__
         self._webhook_name = webhook_name
+        self._admission = AdmissionController(max_concurrency)
+        self._dead_letter = dead_letter
+        self._dead_letter_interval = dead_letter_interval
+        self._replay_task: Optional[asyncio.Task] = None
         self._client = httpx.AsyncClient(timeout=self._timeout)
+        # Static part of every request's headers, merged once here
+        self._base_headers: Dict[str, str] = {
+            "Content-Type": "application/json",
+            **self._extra_headers,
+        }
 
     @property
     def name(self) -> str:
@@ -82,18 +210,11 @@ class WebhookNotifier(NotificationProvider):
     def is_configured(self) -> bool:
         return bool(self._url)
 
-    def supports_event(self, event_type: EventType) -> bool:
-        if self._event_filter is None:
-            return True
-        return event_type in self._event_filter
-
     def _sign_payload(self, payload_bytes: bytes) -> str:
         """Compute HMAC-SHA256 signature."""
-        return hmac.new(
-            self._secret.encode("utf-8"),
-            payload_bytes,
-            hashlib.sha256,
-        ).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(payload_bytes)
+        return mac.hexdigest()
 
     def _build_payload(self, event: NotificationEvent) -> Dict[str, Any]:
         """Build the webhook JSON payload."""
@@ -109,20 +230,41 @@ class WebhookNotifier(NotificationProvider):
             "team_id": event.team_id,
             "team_name": event.team_name,
             "data": event.data,
-            "timestamp": event.timestamp.isoformat(),
+            "timestamp": event.timestamp,  # datetimes are encoded by _dumps
             "source": "alfred",
         }
 
     async def send(self, event: NotificationEvent) -> bool:
         """Send a webhook POST with retry + backoff."""
-        payload = self._build_payload(event)
-        payload_bytes = json.dumps(payload, default=str).encode("utf-8")
+        payload_bytes = _dumps(self._build_payload(event))
+        delivered, retryable, last_error = await self._deliver(
+            event.event_type.value, event.event_id, payload_bytes
+        )
+        if not delivered and retryable and self._dead_letter is not None:
+            await self._park(
+                {
+                    "event_id": event.event_id,
+                    "event_type": event.event_type.value,
+                    "payload": payload_bytes.decode("utf-8"),
+                    "error": last_error,
+                    "replays": 0,
+                }
+            )
+        return delivered
+
+    async def _deliver(
+        self, event_type: str, event_id: str, payload_bytes: bytes
+    ) -> Tuple[bool, bool, Optional[str]]:
+        """
+        POST a serialized payload with retry + backoff.
 
+        Returns (delivered, retryable, last_error); retryable is False when
+        the endpoint rejected the request outright.
+        """
         headers: Dict[str, str] = {
-            "Content-Type": "application/json",
-            "X-Alfred-Event": event.event_type.value,
-            "X-Alfred-Event-ID": event.event_id,
-            **self._extra_headers,
+            **self._base_headers,
+            "X-Alfred-Event": event_type,
+            "X-Alfred-Event-ID": event_id,
         }
 
         if self._secret:
@@ -130,6 +272,7 @@ class WebhookNotifier(NotificationProvider):
 
         last_error: Optional[str] = None
         for attempt in range(1, self._max_retries + 1):
+            retry_after: Optional[str] = None
             try:
                 resp = await self._client.post(
                     self._url,
@@ -139,15 +282,23 @@ class WebhookNotifier(NotificationProvider):
                 if 200 <= resp.status_code < 300:
                     logger.info(
                         f"webhook:{self._webhook_name}: delivered event "
-                        f"{event.event_id} (attempt {attempt})"
+                        f"{event_id} (attempt {attempt})"
                     )
-                    return True
-                else:
-                    last_error = f"HTTP {resp.status_code}: {resp.text[:200]}"
-                    logger.warning(
-                        f"webhook:{self._webhook_name}: attempt {attempt} "
-                        f"failed: {last_error}"
+                    return True, False, None
+                last_error = f"HTTP {resp.status_code}: {resp.text[:200]}"
+                if resp.status_code not in _RETRYABLE_STATUS and resp.status_code < 500:
+                    # The request itself was rejected; retrying won't help
+                    logger.error(
+                        f"webhook:{self._webhook_name}: event {event_id} "
+                        f"rejected, not retrying: {last_error}"
                     )
+                    return False, False, last_error
+                if resp.status_code in (429, 503):
+                    retry_after = resp.headers.get("Retry-After")
+                logger.warning(
+                    f"webhook:{self._webhook_name}: attempt {attempt} "
+                    f"failed: {last_error}"
+                )
             except Exception as e:
                 last_error = str(e)
                 logger.warning(
@@ -155,27 +306,96 @@ class WebhookNotifier(NotificationProvider):
                     f"exception: {last_error}"
                 )
 
-            # Exponential backoff: 1s, 2s, 4s ...
+            # Exponential backoff: ~1s, 2s, 4s ... capped, with jitter so
+            # notifiers failing together don't retry in lockstep
             if attempt < self._max_retries:
-                backoff = 2 ** (attempt - 1)
-                import asyncio
-                await asyncio.sleep(backoff)
+                backoff = min(self._max_backoff, 2 ** (attempt - 1)) * (0.5 + random.random())
+                await asyncio.sleep(parse_retry_after(retry_after, default=backoff))
 
         logger.error(
             f"webhook:{self._webhook_name}: exhausted {self._max_retries} retries "
-            f"for event {event.event_id}: {last_error}"
+            f"for event {event_id}: {last_error}"
         )
-        return False
+        return False, True, last_error
+
+    async def _park(self, entry: Dict[str, Any]) -> None:
+        """Hand an undeliverable event to the dead-letter queue."""
+        try:
+            await self._dead_letter.enqueue(entry)
+        except Exception as e:
+            logger.error(
+                f"webhook:{self._webhook_name}: failed to park event "
+                f"{entry['event_id']}: {e}"
+            )
+
+    def start(self) -> None:
+        """Start the background dead-letter replay; no-op without a queue."""
+        if self._dead_letter is None:
+            return
+        if self._replay_task is None or self._replay_task.done():
+            self._replay_task = asyncio.create_task(self._replay_loop())
+
+    async def _replay_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._dead_letter_interval)
+            try:
+                await self.replay_dead_letters()
+            except Exception as e:
+                logger.warning(f"webhook:{self._webhook_name}: dead-letter replay failed: {e}")
+
+    async def replay_dead_letters(self, limit: int = 100) -> int:
+        """
+        Re-attempt up to ``limit`` parked events.
+
+        Replays run one at a time so a recovering endpoint isn't hit with
+        the whole backlog at once. Entries that fail again are re-parked
+        until they reach the queue's max_replays.
+
+        Returns:
+            Number of events delivered.
+        """
+        if self._dead_letter is None:
+            return 0
+
+        delivered = 0
+        for entry in await self._dead_letter.drain(limit):
+            ok, retryable, error = await self._deliver(
+                entry["event_type"], entry["event_id"], entry["payload"].encode("utf-8")
+            )
+            if ok:
+                delivered += 1
+            elif retryable and entry["replays"] + 1 < self._dead_letter.max_replays:
+                await self._dead_letter.enqueue(
+                    {**entry, "error": error, "replays": entry["replays"] + 1}
+                )
+            else:
+                logger.error(
+                    f"webhook:{self._webhook_name}: dropping event {entry['event_id']} "
+                    f"after {entry['replays'] + 1} replays: {error}"
+                )
+        return delivered
 
     async def send_batch(self, events: List[NotificationEvent]) -> Dict[str, bool]:
-        """Send multiple events sequentially."""
-        results = {}
-        for event in events:
-            results[event.event_id] = await self.send(event)
-        return results
+        """Send multiple events concurrently, bounded by max_concurrency."""
+
+        async def _send_admitted(event: NotificationEvent) -> bool:
+            async with self._admission:
+                return await self.send(event)
+
+        # One slow or failing delivery must not stall or hide the others.
+        results = await asyncio.gather(
+            *(_send_admitted(e) for e in events), return_exceptions=True
+        )
+        return {event.event_id: result is True for event, result in zip(events, results)}
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop dead-letter replay and close the HTTP client."""
+        if self._replay_task and not self._replay_task.done():
+            self._replay_task.cancel()
+            try:
+                await self._replay_task
+            except asyncio.CancelledError:
+                pass
         await self._client.aclose()
 
 
@@ -187,6 +407,9 @@ def create_webhook_notifier(
     timeout: float = 10.0,
     event_filter: Optional[List[EventType]] = None,
     webhook_name: str = "default",
+    max_concurrency: int = 16,
+    max_backoff: float = 30.0,
+    dead_letter: Optional[WebhookDeadLetterQueue] = None,
 ) -> WebhookNotifier:
     """Factory function for creating a WebhookNotifier."""
     return WebhookNotifier(
@@ -197,4 +420,7 @@ def create_webhook_notifier(
         timeout=timeout,
         event_filter=event_filter,
         webhook_name=webhook_name,
+        max_concurrency=max_concurrency,
+        max_backoff=max_backoff,
+        dead_letter=dead_letter,
     )
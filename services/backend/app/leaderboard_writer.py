@@ -0,0 +1,152 @@
+"""
+Leaderboard Write-Behind Queue
+
+Leaderboards are gamification data and tolerate a short delay, so chat
+completions do not upsert them inline. Once a request's settlement has
+committed, the proxy hands its counters to an in-process queue (so only
+settled requests are ever counted), and a background loop started by the
+application lifespan writes them in batches: deltas collected within one
+window are summed per user and applied as one upsert per (user, period),
+all under a single commit.
+
+When no writer is running (scripts, tests without a lifespan) or the queue
+is full, accepting() is False and the caller updates the leaderboard inside
+its own transaction instead.
+"""
+
+import asyncio
+import logging
+import uuid
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from sqlmodel import Session
+
+from . import database as app_database
+from .logic import EfficiencyScorer, UnitOfWork
+from .metrics import leaderboard_deltas_dropped_total
+from .models import RequestLog
+
+logger = logging.getLogger(__name__)
+
+# Leaderboard buckets maintained for every request.
+PERIOD_TYPES = ("daily", "monthly")
+
+# Flush after this many deltas, or once the window has elapsed.
+_BATCH_SIZE = 64
+_BATCH_WINDOW = 0.25  # seconds
+
+# Backpressure bound: past this, callers fall back to inline updates.
+_QUEUE_SIZE = 10_000
+
+
+class LeaderboardDelta(NamedTuple):
+    """One request's contribution to its owner's leaderboard buckets."""
+
+    user_id: uuid.UUID
+    prompt_tokens: int
+    completion_tokens: int
+    cost_credits: Decimal
+
+    @classmethod
+    def from_log(cls, request_log: RequestLog) -> "LeaderboardDelta":
+        return cls(
+            request_log.user_id,
+            request_log.prompt_tokens,
+            request_log.completion_tokens,
+            request_log.cost_credits,
+        )
+
+
+_queue: Optional[asyncio.Queue] = None
+
+
+def accepting() -> bool:
+    """True when the writer is running and has room for another delta."""
+    return _queue is not None and not _queue.full()
+
+
+def submit(delta: LeaderboardDelta) -> bool:
+    """
+    Queue a settled request's leaderboard counters for the background writer.
+
+    Must be called from the event loop running the writer. Returns False
+    when the writer is not running or the queue is full.
+    """
+    if _queue is None:
+        return False
+    try:
+        _queue.put_nowait(delta)
+    except asyncio.QueueFull:
+        return False
+    return True
+
+
+def _flush(deltas: Iterable[LeaderboardDelta]) -> None:
+    """Sum deltas per user and apply them in one transaction."""
+    totals: Dict[uuid.UUID, List] = {}
+    for delta in deltas:
+        agg = totals.setdefault(delta.user_id, [0, 0, 0, Decimal("0")])
+        agg[0] += 1
+        agg[1] += delta.prompt_tokens
+        agg[2] += delta.completion_tokens
+        agg[3] += delta.cost_credits
+    if not totals:
+        return
+
+    try:
+        with Session(app_database.get_engine()) as session, UnitOfWork(session):
+            scorer = EfficiencyScorer(session)
+            for user_id, (requests, prompt, completion, cost) in totals.items():
+                for period_type in PERIOD_TYPES:
+                    scorer.add_to_leaderboard(
+                        user_id, period_type, requests, prompt, completion, cost
+                    )
+    except Exception:
+        dropped = sum(agg[0] for agg in totals.values())
+        leaderboard_deltas_dropped_total.inc(dropped)
+        logger.exception(
+            "Leaderboard flush failed — %d deltas for %d users dropped", dropped, len(totals)
+        )
+
+
+async def _collect(queue: asyncio.Queue, batch: List[LeaderboardDelta]) -> None:
+    """
+    Wait for one delta, then gather more until the batch or window is full.
+
+    Fills ``batch`` in place so a cancellation mid-collection loses nothing.
+    One deadline covers the whole window; per-get wait_for calls could
+    swallow a cancellation that lands as a get completes (Python < 3.12).
+    """
+    batch.append(await queue.get())
+    try:
+        async with asyncio.timeout(_BATCH_WINDOW):
+            while len(batch) < _BATCH_SIZE:
+                batch.append(await queue.get())
+    except TimeoutError:
+        pass
+
+
+async def leaderboard_writer_loop():
+    """
+    Background loop that drains the leaderboard queue in batches.
+
+    On cancellation the queue is closed to new submissions and everything
+    still pending is flushed before the loop exits.
+    """
+    global _queue
+    queue = _queue = asyncio.Queue(maxsize=_QUEUE_SIZE)
+    logger.info("Leaderboard writer started (batch=%d, window=%.2fs)", _BATCH_SIZE, _BATCH_WINDOW)
+
+    collected: List[LeaderboardDelta] = []
+    try:
+        while True:
+            await _collect(queue, collected)
+            batch, collected = collected, []
+            await asyncio.to_thread(_flush, batch)
+    except asyncio.CancelledError:
+        _queue = None
+        while not queue.empty():
+            collected.append(queue.get_nowait())
+        _flush(collected)
+        logger.info("Leaderboard writer stopped (cancelled)")
@@ -17,7 +17,12 @@ from sqlmodel import Session, SQLModel, select
 
 from .config import settings
 from . import database as app_database
-from .integrations import setup_notifications
+from .integrations import (
+    WebhookDeadLetterQueue,
+    WebhookNotifier,
+    get_notification_manager,
+    setup_notifications,
+)
 from .logging_config import get_logger
 from .models import OrgSettings
 
@@ -144,6 +149,11 @@ def setup_notifications_if_enabled():
                 teams_webhook_url=settings.teams_webhook_url,
                 # Additional notification sinks can be mapped here
                 telegram_bot_token=getattr(settings, "telegram_bot_token", None),
+                webhook_url=settings.webhook_url,
+                webhook_secret=settings.webhook_secret,
+                webhook_dead_letter=(
+                    webhook_dead_letter_queue() if settings.webhook_url else None
+                ),
             )
             logger.info("Integrations: Notification subsystem online.")
         except Exception as e:
@@ -152,6 +162,70 @@ def setup_notifications_if_enabled():
             )
 
 
+def webhook_dead_letter_queue():
+    """
+    Dead-Letter Parking for the Outbound Webhook.
+
+    Backed by Redis when it is enabled, so events that exhausted their
+    retries survive a restart. The queue degrades to process memory on
+    Redis errors, so the client is not probed here.
+    """
+    redis_client = None
+    if settings.redis_enabled:
+        try:
+            from redis import asyncio as aioredis
+
+            redis_client = aioredis.Redis(
+                host=settings.redis_host,
+                port=settings.redis_port,
+                db=settings.redis_db,
+                socket_connect_timeout=2,  # Fast fail on connect
+                socket_timeout=2,  # Fast fail on command
+            )
+        except ImportError:
+            logger.warning("Webhook dead-letter queue: redis not installed, using memory.")
+    return WebhookDeadLetterQueue(redis_client)
+
+
+def webhook_notifiers():
+    """Webhook providers registered on the notification manager."""
+    return [p for p in get_notification_manager().providers if isinstance(p, WebhookNotifier)]
+
+
+# Connections opened on the rate limiter's pool before traffic arrives
+REDIS_WARM_CONNECTIONS = 4
+REDIS_WARM_TIMEOUT = 2.0  # seconds; an unreachable Redis must not stall boot
+
+
+async def warm_redis_pool(app: FastAPI) -> None:
+    """
+    Connection Pre-Warming.
+
+    Opens a few connections on the rate limiter's Redis pool so the first
+    requests do not pay TCP/TLS setup on the rate-limit check. Concurrent
+    pings each check out their own connection, which then stays idle in the
+    pool. Best-effort: failures are logged and startup continues.
+    """
+    import asyncio
+
+    pool = getattr(app.state, "redis_pool", None)
+    if pool is None:
+        return
+
+    from redis import Redis
+
+    client = Redis(connection_pool=pool)
+    warm = min(REDIS_WARM_CONNECTIONS, pool.max_connections)
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(asyncio.to_thread(client.ping) for _ in range(warm))),
+            timeout=REDIS_WARM_TIMEOUT,
+        )
+        logger.info(f"Redis pool warmed with {warm} connections.")
+    except Exception as e:
+        logger.warning(f"Redis pool warm-up skipped: {e}")
+
+
 @asynccontextmanager
 async def alfred_lifespan(app: FastAPI) -> AsyncGenerator:
     """
@@ -173,11 +247,34 @@ async def alfred_lifespan(app: FastAPI) -> AsyncGenerator:
     _wallet_reset_task = None
     _daily_digest_task = None
     _audit_verify_task = None
+    _leaderboard_task = None
     try:
         # Pre-flight initialization sequence
         create_tables_if_needed(get_engine())
         initialize_org_settings(get_engine())
         setup_notifications_if_enabled()
+        await warm_redis_pool(app)
+
+        # Report store on Redis, probed here rather than at import
+        try:
+            from .routers.custom_reports import connect_report_store
+
+            await connect_report_store()
+        except Exception as e:
+            logger.warning(f"Report store failed to connect to Redis: {e}")
+
+        # Replay webhook deliveries parked in the dead-letter queue
+        for notifier in webhook_notifiers():
+            notifier.start()
+
+        # Teams bot warm-up plus its token and signing-key refreshers; router
+        # on_startup hooks never run under this lifespan
+        try:
+            from .integrations.teams_bot import start_teams_routers
+
+            await start_teams_routers()
+        except Exception as e:
+            logger.warning(f"Teams bot background tasks failed to start: {e}")
 
         # Start wallet reset cron (T056)
         try:
@@ -209,6 +306,15 @@ async def alfred_lifespan(app: FastAPI) -> AsyncGenerator:
         except Exception as e:
             logger.warning(f"Audit verification cron failed to start: {e}")
 
+        # Start batched leaderboard writer (off the chat completion path)
+        try:
+            from .leaderboard_writer import leaderboard_writer_loop
+
+            _leaderboard_task = asyncio.create_task(leaderboard_writer_loop())
+            logger.info("Leaderboard writer task scheduled.")
+        except Exception as e:
+            logger.warning(f"Leaderboard writer failed to start: {e}")
+
         yield  # Start serving requests
 
     except Exception as e:
@@ -216,11 +322,55 @@ async def alfred_lifespan(app: FastAPI) -> AsyncGenerator:
         raise
     finally:
         # Cancel background tasks on shutdown
-        for task in (_wallet_reset_task, _daily_digest_task, _audit_verify_task):
+        for task in (
+            _wallet_reset_task,
+            _daily_digest_task,
+            _audit_verify_task,
+            _leaderboard_task,
+        ):
             if task and not task.done():
                 task.cancel()
                 try:
                     await task
                 except asyncio.CancelledError:
                     pass
+
+        # Release the rate limiter's Redis connections
+        redis_pool = getattr(app.state, "redis_pool", None)
+        if redis_pool is not None:
+            try:
+                redis_pool.disconnect()
+            except Exception as e:
+                logger.warning(f"Redis pool failed to close: {e}")
+
+        # Release the report store's Redis connections
+        try:
+            from .routers.custom_reports import close_report_store
+
+            await close_report_store()
+        except Exception as e:
+            logger.warning(f"Report store Redis connections failed to close: {e}")
+
+        # Stop Teams workers and refreshers and close the bots' HTTP clients
+        try:
+            from .integrations.teams_bot import stop_teams_routers
+
+            await stop_teams_routers()
+        except Exception as e:
+            logger.warning(f"Teams bot failed to shut down: {e}")
+
+        # Stop dead-letter replay and close the webhook HTTP clients
+        for notifier in webhook_notifiers():
+            try:
+                await notifier.close()
+            except Exception as e:
+                logger.warning(f"Webhook notifier failed to close: {e}")
+
+        # Release the pooled connections shared by all Slack notifiers
+        try:
+            from .integrations.slack import SlackNotifier
+
+            await SlackNotifier.close_shared_client()
+        except Exception as e:
+            logger.warning(f"Slack HTTP client failed to close: {e}")
         logger.info("Alfred Core Shutdown: All lifecycle hooks released.")
@@ -17,15 +17,21 @@ to ensure mission-critical work is never blocked by rigid administrative silos.
 """
 
 import hashlib
+import json
 import secrets
+import threading
+import time
 import uuid
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Tuple
 
 from litellm import completion, completion_cost
-from sqlalchemy import func
+from sqlalchemy import case, func, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
 from sqlmodel import Session, select
 
 from .constants import CreditConversion
@@ -50,10 +56,17 @@ except ImportError:
     TENACITY_AVAILABLE = False
     retry_logger = None
 
+try:
+    import orjson
+except ImportError:
+    # orjson is an optional speedup; fall back to the stdlib encoder.
+    orjson = None
+
 from .config import settings
 from .models import (
     ApprovalRequest,
     ChatCompletionRequest,
+    ChatMessage,
     LeaderboardEntry,
     OrgSettings,
     ProjectPriority,
@@ -65,7 +78,7 @@ from .models import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class QuotaCheckResult:
     """
     Governance Decision Object.
@@ -80,7 +93,7 @@ class QuotaCheckResult:
     approval_instructions: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CostEstimate:
     """Logical prediction for pre-flight billing checks."""
 
@@ -92,6 +105,55 @@ class CostEstimate:
     model: str
 
 
+# --- Transaction Scoping ---
+
+_UOW_DEPTH_KEY = "alfred.unit_of_work_depth"
+
+
+def _commit(session: Session) -> bool:
+    """
+    Commit, or only flush when running inside a UnitOfWork.
+
+    Returns True if the transaction was actually committed.
+    """
+    if session.info.get(_UOW_DEPTH_KEY):
+        session.flush()
+        return False
+    session.commit()
+    return True
+
+
+class UnitOfWork:
+    """
+    Settlement Transaction Scope.
+
+    Ledger writes issued on ``session`` inside the block (deduction, audit
+    log, leaderboard) flush instead of committing, and the block commits
+    once on exit -- one COMMIT per request rather than one per write, and
+    the writes land or roll back together. Nested blocks defer to the
+    outermost one.
+    """
+
+    __slots__ = ("session",)
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def __enter__(self) -> "UnitOfWork":
+        self.session.info[_UOW_DEPTH_KEY] = self.session.info.get(_UOW_DEPTH_KEY, 0) + 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        depth = self.session.info[_UOW_DEPTH_KEY] - 1
+        self.session.info[_UOW_DEPTH_KEY] = depth
+        if depth == 0:
+            if exc_type is None:
+                self.session.commit()
+            else:
+                self.session.rollback()
+        return False
+
+
 # --- 1. The Credit Ledger: Mapping Raw Tokens to Org-Value ---
 
 
@@ -146,51 +208,116 @@ class CreditCalculator:
             pass
 
         # Heuristic Logic
-        rate = cls._get_rate_for_model(model)
         total_tokens = prompt_tokens + completion_tokens
-        return (Decimal(total_tokens) / Decimal("1000")) * rate * cls.USD_TO_CREDITS
+        return Decimal(total_tokens) * _PER_TOKEN_CREDITS[_match_rate_key(model)]
 
     @classmethod
     def _get_rate_for_model(cls, model: str) -> Decimal:
         """Pattern-matching tier identification."""
-        model_lower = model.lower()
-        for key, rate in cls.FALLBACK_RATES.items():
-            if key in model_lower:
-                return rate
-        return cls.FALLBACK_RATES["default"]
+        return cls.FALLBACK_RATES[_match_rate_key(model)]
 
     @classmethod
     def estimate_cost(cls, model: str, estimated_tokens: int) -> Decimal:
         """Pre-flight predictor used to deny requests before they incur vendor costs."""
-        rate = cls._get_rate_for_model(model)
-        return (Decimal(estimated_tokens) / Decimal("1000")) * rate * cls.USD_TO_CREDITS
+        return Decimal(estimated_tokens) * _PER_TOKEN_CREDITS[_match_rate_key(model)]
+
+
+# Longest key first so the most specific family wins: "gpt-4o-mini" must not
+# be billed at the "gpt-4" rate just because that key happens to come first.
+_FALLBACK_RATES_SORTED = tuple(
+    sorted(CreditCalculator.FALLBACK_RATES.items(), key=lambda kv: -len(kv[0]))
+)
+
+# Fallback rates pre-scaled to credits per single token
+_PER_TOKEN_CREDITS = {
+    key: rate * CreditCalculator.USD_TO_CREDITS / Decimal("1000")
+    for key, rate in CreditCalculator.FALLBACK_RATES.items()
+}
+
+
+# Keyed on the raw model string: deployments see a few dozen distinct names,
+# so warm lookups skip both the lower() and the substring scan.
+@lru_cache(maxsize=512)
+def _match_rate_key(model: str) -> str:
+    """Resolve a model name to its FALLBACK_RATES key."""
+    model_lower = model.lower()
+    for key, _ in _FALLBACK_RATES_SORTED:
+        if key in model_lower:
+            return key
+    return "default"
 
 
 # --- 2. The Balancer: Multi-Tier Quota Allocation ---
 
 
+class OrgPolicy(NamedTuple):
+    """The OrgSettings switches consulted by the quota cascade."""
+
+    allow_priority_bypass: bool
+    allow_vacation_sharing: bool
+
+
+class _OrgSettingsCache:
+    """
+    Process-wide snapshot of the org policy switches.
+
+    QuotaManager is built per request, so a per-instance lookup meant one
+    OrgSettings SELECT per request for values that only change on admin
+    action. The snapshot holds plain booleans rather than the ORM row so it
+    never outlives the session that loaded it. Call invalidate() after
+    writing OrgSettings to apply the change before the TTL runs out.
+    """
+
+    TTL_SECONDS = 30.0
+
+    _lock = threading.Lock()
+    _value: Optional[OrgPolicy] = None
+    _expires_at: float = 0.0
+
+    @classmethod
+    def get(cls, session: Session, ttl: float = TTL_SECONDS) -> OrgPolicy:
+        value = cls._value
+        if value is not None and time.monotonic() < cls._expires_at:
+            return value
+        with cls._lock:
+            if cls._value is not None and time.monotonic() < cls._expires_at:
+                return cls._value
+            org_settings = session.exec(select(OrgSettings)).first()
+            if org_settings is None:
+                # JIT creation of the singleton row
+                org_settings = OrgSettings()
+                session.add(org_settings)
+                session.commit()
+                session.refresh(org_settings)
+            cls._value = OrgPolicy(
+                allow_priority_bypass=org_settings.allow_priority_bypass,
+                allow_vacation_sharing=org_settings.allow_vacation_sharing,
+            )
+            cls._expires_at = time.monotonic() + ttl
+            return cls._value
+
+    @classmethod
+    def invalidate(cls) -> None:
+        with cls._lock:
+            cls._value = None
+
+
 class QuotaManager:
     """
     Inland Revenue for AI Tokens.
     Implements the core 'Elastic Quota' algorithm.
     """
 
+    # Instantiated per request; org policy lives in the shared snapshot
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         self.session = session
-        self._org_settings: Optional[OrgSettings] = None
 
     @property
-    def org_settings(self) -> OrgSettings:
-        """Dynamic governance settings pulled from DB with JIT creation."""
-        if self._org_settings is None:
-            statement = select(OrgSettings)
-            self._org_settings = self.session.exec(statement).first()
-            if self._org_settings is None:
-                self._org_settings = OrgSettings()
-                self.session.add(self._org_settings)
-                self.session.commit()
-                self.session.refresh(self._org_settings)
-        return self._org_settings
+    def org_settings(self) -> OrgPolicy:
+        """Governance switches from the shared OrgSettings snapshot."""
+        return _OrgSettingsCache.get(self.session)
 
     def check_quota(
         self,
@@ -217,9 +344,13 @@ class QuotaManager:
                 message="Deducting from personal allowance.",
             )
 
+        # Team-level liquidity for tiers 2 and 3, fetched at most once
+        liquidity: Optional[Tuple[Decimal, Decimal]] = None
+
         # --- TIER 2: MISSION-CRITICAL OVERRIDE ---
         if priority == ProjectPriority.CRITICAL and self.org_settings.allow_priority_bypass:
-            team_pool = self._get_total_team_pool(user)
+            liquidity = self._get_team_liquidity(user)
+            team_pool = liquidity[0]
             if team_pool >= estimated_cost:
                 return QuotaCheckResult(
                     allowed=True,
@@ -230,7 +361,9 @@ class QuotaManager:
 
         # --- TIER 3: VACATION LIQUIDITY ---
         if self.org_settings.allow_vacation_sharing:
-            vacation_credits = self._get_vacation_share_credits(user)
+            if liquidity is None:
+                liquidity = self._get_team_liquidity(user)
+            vacation_credits = liquidity[1]
             if vacation_credits >= estimated_cost:
                 return QuotaCheckResult(
                     allowed=True,
@@ -257,50 +390,60 @@ class QuotaManager:
             },
         )
 
-    def _get_total_team_pool(self, user: User) -> Decimal:
-        """Aggregate available credits across all user memberships."""
-        # Use a single aggregate query to compute the sum of available_pool across teams
-        # Compute available_pool as (common_pool - used_pool) at SQL-level
+    def _get_team_liquidity(self, user: User) -> Tuple[Decimal, Decimal]:
+        """
+        Team pool and vacation-share credits across all user memberships.
+
+        Both aggregates come from one query over the user's teams:
+        - team pool: sum of (common_pool - used_pool)
+        - vacation share: the same, scaled by vacation_share_percentage, but
+          only for teams where another member is ON_VACATION
+        """
         available_expr = Team.common_pool - Team.used_pool
+        # Separate alias: the outer query already joins TeamMemberLink for the
+        # user's own memberships, and the subquery must not correlate to it
+        colleague_link = aliased(TeamMemberLink)
+        colleague_on_vacation = (
+            select(colleague_link.team_id)
+            .join(User, colleague_link.user_id == User.id)
+            .where(
+                colleague_link.team_id == Team.id,
+                User.status == UserStatus.ON_VACATION,
+                User.id != user.id,
+            )
+            .correlate(Team)
+            .exists()
+        )
+        share_expr = case(
+            (colleague_on_vacation, available_expr * Team.vacation_share_percentage / 100),
+            else_=0,
+        )
         stmt = (
-            select(func.coalesce(func.sum(available_expr), 0))
+            select(
+                func.coalesce(func.sum(available_expr), 0),
+                func.coalesce(func.sum(share_expr), 0),
+            )
             .select_from(Team)
             .join(TeamMemberLink, Team.id == TeamMemberLink.team_id)
             .where(TeamMemberLink.user_id == user.id)
         )
-        result = self.session.exec(stmt).one()
-        total = result if result is not None else 0
+        team_pool, vacation_credits = self.session.exec(stmt).one()
+        return self._to_decimal(team_pool), self._to_decimal(vacation_credits)
+
+    @staticmethod
+    def _to_decimal(value) -> Decimal:
         try:
-            return Decimal(str(total))
+            return Decimal(str(value if value is not None else 0))
         except Exception:
             return Decimal("0.00")
 
+    def _get_total_team_pool(self, user: User) -> Decimal:
+        """Aggregate available credits across all user memberships."""
+        return self._get_team_liquidity(user)[0]
+
     def _get_vacation_share_credits(self, user: User) -> Decimal:
         """Heuristic: If 1+ member is away, unlock a capped percentage of the pool."""
-        # Find teams the user is a member of and that have at least one other member on vacation
-        # Build a subquery of team_ids that have vacationing members (excluding the user)
-        vacationing_team_ids = (
-            select(TeamMemberLink.team_id)
-            .join(User, TeamMemberLink.user_id == User.id)
-            .where(User.status == UserStatus.ON_VACATION, User.id != user.id)
-            .distinct()
-            .subquery()
-        )
-
-        # Calculate vacation_share_limit at SQL level: ((common_pool - used_pool) * vacation_share_percentage) / 100
-        share_expr = (Team.common_pool - Team.used_pool) * Team.vacation_share_percentage / 100
-        stmt = (
-            select(func.coalesce(func.sum(share_expr), 0))
-            .select_from(Team)
-            .where(Team.id.in_(select(vacationing_team_ids.c.team_id)))
-            .where(Team.id.in_(select(TeamMemberLink.team_id).where(TeamMemberLink.user_id == user.id)))
-        )
-        result = self.session.exec(stmt).one()
-        total = result if result is not None else 0
-        try:
-            return Decimal(str(total))
-        except Exception:
-            return Decimal("0.00")
+        return self._get_team_liquidity(user)[1]
 
     def _get_vacation_members(self, team: Team, exclude_user: User) -> List[User]:
         """Find colleagues whose status is 'ON_VACATION'."""
@@ -311,15 +454,16 @@ class QuotaManager:
             .where(User.id != exclude_user.id)
             .where(User.status == UserStatus.ON_VACATION)
         )
-        return list(self.session.exec(statement).all())
+        return self.session.exec(statement).all()
 
     def deduct_quota(
         self, user: User, cost: Decimal, source: str, team: Optional[Team] = None
     ) -> None:
         """Atomic deduction logic across ledgers."""
+        now = datetime.now(timezone.utc)
         if source == "personal":
             user.used_tokens += cost
-            user.last_request_at = datetime.now(timezone.utc)
+            user.last_request_at = now
             self.session.add(user)
         elif source in ("team_pool", "priority_bypass", "vacation_share"):
             if team is None:
@@ -329,11 +473,11 @@ class QuotaManager:
                 ).first()
             if team:
                 team.used_pool += cost
-                team.updated_at = datetime.now(timezone.utc)
+                team.updated_at = now
                 self.session.add(team)
-            user.last_request_at = datetime.now(timezone.utc)
+            user.last_request_at = now
             self.session.add(user)
-        self.session.commit()
+        _commit(self.session)
 
     def add_quota(self, user: User, amount: Decimal) -> None:
         """Atomic quota injection."""
@@ -346,6 +490,16 @@ class QuotaManager:
 # --- 3. Behavioral Scant: The Gamification Layer ---
 
 
+def _period_start(now: datetime, period_type: str) -> datetime:
+    """Start of the daily / weekly / monthly leaderboard bucket containing ``now``."""
+    midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    if period_type == "daily":
+        return midnight
+    if period_type == "weekly":
+        return midnight - timedelta(days=now.weekday())
+    return midnight.replace(day=1)
+
+
 class EfficiencyScorer:
     """
     The 'Token-Frugality' Metric.
@@ -353,29 +507,23 @@ class EfficiencyScorer:
     Score = (Complexity of Output / Verbosity of Input).
     """
 
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         self.session = session
 
     @staticmethod
-    def calculate_efficiency_score(prompt_tokens: int, completion_tokens: int) -> Decimal:
-        """Ordinal efficiency score."""
+    def calculate_efficiency_score(prompt_tokens: int, completion_tokens: int) -> float:
+        """Ordinal efficiency score (gamification only, so float precision is fine)."""
         if prompt_tokens == 0:
-            return Decimal("0.00")
-        return round(Decimal(completion_tokens) / Decimal(prompt_tokens), 4)
+            return 0.0
+        return round(completion_tokens / prompt_tokens, 4)
 
     def get_leaderboard(
         self, period_type: str = "daily", limit: int = 10
     ) -> List[LeaderboardEntry]:
         """Fetch the current leaderboard entries for a given period."""
-        now = datetime.now(timezone.utc)
-        if period_type == "daily":
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif period_type == "weekly":
-            period_start = (now - timedelta(days=now.weekday())).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-        else:
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        period_start = _period_start(datetime.now(timezone.utc), period_type)
 
         statement = (
             select(LeaderboardEntry)
@@ -384,60 +532,108 @@ class EfficiencyScorer:
             .order_by(LeaderboardEntry.avg_efficiency_score.desc())
             .limit(limit)
         )
-        return list(self.session.exec(statement).all())
+        return self.session.exec(statement).all()
 
     def update_leaderboard(
         self, user: User, request_log: RequestLog, period_type: str = "daily"
     ) -> LeaderboardEntry:
         """Asynchronous update of the performance leaderboard."""
-        now = datetime.now(timezone.utc)
+        entry = self.add_to_leaderboard(
+            user.id,
+            period_type,
+            requests=1,
+            prompt_tokens=request_log.prompt_tokens,
+            completion_tokens=request_log.completion_tokens,
+            cost_credits=request_log.cost_credits,
+        )
+        _commit(self.session)
+        return entry
+
+    def add_to_leaderboard(
+        self,
+        user_id: uuid.UUID,
+        period_type: str,
+        requests: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        cost_credits: Decimal,
+        now: Optional[datetime] = None,
+    ) -> LeaderboardEntry:
+        """
+        Add pre-aggregated counters to a user's current bucket (no commit).
+
+        A single INSERT ... ON CONFLICT DO UPDATE: the database adds the
+        counters onto the existing bucket row, so concurrent writers for the
+        same user cannot overwrite each other's totals.
+        """
+        now = now or datetime.now(timezone.utc)
 
         # Temporal bucketing logic
-        if period_type == "daily":
-            period_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif period_type == "weekly":
-            period_start = (now - timedelta(days=now.weekday())).replace(
-                hour=0, minute=0, second=0, microsecond=0
-            )
-        else:
-            period_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        period_start = _period_start(now, period_type)
 
-        statement = select(LeaderboardEntry).where(
-            LeaderboardEntry.user_id == user.id,
-            LeaderboardEntry.period_type == period_type,
-            LeaderboardEntry.period_start == period_start,
-        )
-        entry = self.session.exec(statement).first() or LeaderboardEntry(
-            user_id=user.id,
+        dialect = self.session.get_bind().dialect.name
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        statement = insert(LeaderboardEntry).values(
+            id=uuid.uuid4(),
+            user_id=user_id,
             period_start=period_start,
             period_end=period_start
             + (timedelta(days=1) if period_type == "daily" else timedelta(weeks=1)),
             period_type=period_type,
+            total_requests=requests,
+            total_prompt_tokens=prompt_tokens,
+            total_completion_tokens=completion_tokens,
+            total_cost_credits=cost_credits,
+            avg_efficiency_score=Decimal(
+                str(self.calculate_efficiency_score(prompt_tokens, completion_tokens))
+            ),
+            created_at=now,
+            updated_at=now,
         )
 
         # Atomic Aggregation
-        entry.total_requests += 1
-        entry.total_prompt_tokens += request_log.prompt_tokens
-        entry.total_completion_tokens += request_log.completion_tokens
-        entry.total_cost_credits += request_log.cost_credits
-
-        if entry.total_prompt_tokens > 0:
-            entry.avg_efficiency_score = Decimal(entry.total_completion_tokens) / Decimal(
-                entry.total_prompt_tokens
-            )
+        new = statement.excluded
+        total_prompt = LeaderboardEntry.total_prompt_tokens + new.total_prompt_tokens
+        total_completion = LeaderboardEntry.total_completion_tokens + new.total_completion_tokens
+        statement = statement.on_conflict_do_update(
+            index_elements=["user_id", "period_type", "period_start"],
+            set_={
+                "total_requests": LeaderboardEntry.total_requests + new.total_requests,
+                "total_prompt_tokens": total_prompt,
+                "total_completion_tokens": total_completion,
+                "total_cost_credits": LeaderboardEntry.total_cost_credits
+                + new.total_cost_credits,
+                "avg_efficiency_score": case(
+                    (total_prompt > 0, func.round(total_completion * 1.0 / total_prompt, 4)),
+                    else_=LeaderboardEntry.avg_efficiency_score,
+                ),
+                "updated_at": now,
+            },
+        )
 
-        entry.updated_at = now
-        self.session.add(entry)
-        self.session.commit()
-        return entry
+        return self.session.scalars(
+            statement.returning(LeaderboardEntry),
+            execution_options={"populate_existing": True},
+        ).one()
 
 
 # --- 4. The Auditing Layer ---
 
 
+def _dump_messages(messages: List[ChatMessage]) -> str:
+    """Serialize chat messages for the audit log as compact JSON."""
+    if orjson is not None:
+        return orjson.dumps(messages, default=ChatMessage.model_dump).decode()
+    return json.dumps(
+        [m.model_dump() for m in messages], ensure_ascii=False, separators=(",", ":")
+    )
+
+
 class RequestLogger:
     """Ensures a perfect paper trail for compliance."""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -462,9 +658,7 @@ class RequestLogger:
 
         # Content Redaction for High-Privacy Requests
         if not strict_privacy:
-            import json
-
-            messages_json = json.dumps([m.model_dump() for m in request.messages])
+            messages_json = _dump_messages(request.messages)
             choices = response.get("choices", [])
             if choices:
                 response_content = choices[0].get("message", {}).get("content", "")
@@ -489,8 +683,7 @@ class RequestLogger:
         )
 
         self.session.add(log)
-        self.session.commit()
-        self.session.refresh(log)
+        _commit(self.session)
         return log
 
 
@@ -502,7 +695,12 @@ class AuthManager:
 
     @staticmethod
     def hash_api_key(api_key: str) -> str:
-        """One-way cryptographically secure trace of the API secret."""
+        """
+        One-way cryptographically secure trace of the API secret.
+
+        Deliberately not memoized: a cache keyed on the argument would keep
+        plaintext keys resident in process memory.
+        """
         return hashlib.sha256(api_key.encode()).hexdigest()
 
     @staticmethod
@@ -512,6 +710,25 @@ class AuthManager:
         return plaintext, AuthManager.hash_api_key(plaintext)
 
 
+if TENACITY_AVAILABLE:
+    _provider_retry = retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10),
+        before_sleep=before_sleep_log(retry_logger, logging.WARNING),
+        reraise=True,
+    )
+else:
+
+    def _provider_retry(fn):
+        return fn
+
+
+@_provider_retry
+async def _do_completion(**kwargs):
+    """Provider call wrapped once in the shared retry policy."""
+    return await completion(**kwargs)
+
+
 class LLMProxy:
     """The High-Availability Gateway."""
 
@@ -538,20 +755,7 @@ class LLMProxy:
             kwargs.update(api_keys)
 
         # Execution with Tracing & Retries
-        if TENACITY_AVAILABLE:
-
-            @retry(
-                stop=stop_after_attempt(3),
-                wait=wait_exponential(multiplier=1, min=2, max=10),
-                before_sleep=before_sleep_log(retry_logger, logging.WARNING),
-                reraise=True,
-            )
-            async def _call():
-                return await completion(**kwargs)
-
-            response = await _call()
-        else:
-            response = await completion(**kwargs)
+        response = await _do_completion(**kwargs)
 
         return response.model_dump() if hasattr(response, "model_dump") else dict(response)
 
@@ -562,6 +766,8 @@ class LLMProxy:
 class ApprovalManager:
     """Handles the 'Human-in-the-Loop' governance workflow."""
 
+    __slots__ = ("session",)
+
     def __init__(self, session: Session):
         self.session = session
 
@@ -574,11 +780,9 @@ class ApprovalManager:
         team_id: Optional[str] = None,
     ) -> ApprovalRequest:
         """Registers a formal intent to consume more than the allocated budget."""
-        import uuid as uuid_module
-
         approval = ApprovalRequest(
             user_id=user.id,
-            team_id=uuid_module.UUID(team_id) if team_id else None,
+            team_id=uuid.UUID(team_id) if team_id else None,
             requested_credits=requested_credits,
             reason=reason,
             priority=priority,
@@ -591,64 +795,102 @@ class ApprovalManager:
     def approve(
         self, approval_id: str, approver_id: str, approved_credits: Optional[Decimal] = None
     ) -> ApprovalRequest:
-        """Finalizes an audit-compliant quota injection."""
-        import uuid as uuid_module
+        """
+        Finalizes an audit-compliant quota injection.
 
-        approval = self.session.exec(
-            select(ApprovalRequest).where(ApprovalRequest.id == uuid_module.UUID(approval_id))
+        Two UPDATEs in one transaction: the approval row reports back the
+        user and granted amount via RETURNING, and the user's allowance is
+        incremented in SQL so concurrent grants cannot overwrite each other.
+        Only pending requests match, so a request is credited at most once.
+        """
+        now = datetime.now(timezone.utc)
+        approval = self.session.scalars(
+            update(ApprovalRequest)
+            .where(
+                ApprovalRequest.id == uuid.UUID(approval_id),
+                ApprovalRequest.status == "pending",
+            )
+            .values(
+                status="approved",
+                approved_by=uuid.UUID(approver_id),
+                approved_credits=approved_credits or ApprovalRequest.requested_credits,
+                resolved_at=now,
+            )
+            .returning(ApprovalRequest),
+            execution_options={"populate_existing": True},
         ).first()
         if not approval:
+            if self.session.get(ApprovalRequest, uuid.UUID(approval_id)):
+                raise ValueError("Workflow already resolved.")
             raise ValueError("Invalid workflow ID.")
 
-        approval.status = "approved"
-        approval.approved_by = uuid_module.UUID(approver_id)
-        approval.approved_credits = approved_credits or approval.requested_credits
-        approval.resolved_at = datetime.now(timezone.utc)
-
         # Atomic Replenishment
-        user = self.session.exec(select(User).where(User.id == approval.user_id)).first()
-        if user:
-            user.personal_quota += approval.approved_credits
-            user.updated_at = datetime.now(timezone.utc)
-            self.session.add(user)
-
-        self.session.add(approval)
+        self.session.execute(
+            update(User)
+            .where(User.id == approval.user_id)
+            .values(
+                personal_quota=User.personal_quota + approval.approved_credits,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session="fetch")
+        )
         self.session.commit()
         return approval
 
     def allocate_vacation_liquidity(
         self, user_id: uuid.UUID, team_id: uuid.UUID, requested_quota: Decimal
     ):
-        """Allocate vacation liquidity for non-critical requests."""
-        from .models import TeamMemberLink, User, UserStatus
+        """
+        Allocate vacation liquidity for non-critical requests.
 
-        # Fetch team members on vacation
-        vacation_members = self.session.exec(
-            select(User).where(
-                User.status == UserStatus.ON_VACATION,
+        Members are drained greedily in id order. The running headroom is
+        computed with a window function so the whole allocation is a single
+        UPDATE; the pool-total check lives in the same statement, so a
+        concurrent burn cannot slip between the check and the deduction.
+        """
+        # Nothing to allocate; the UPDATE would match no rows and report failure
+        if requested_quota <= 0:
+            return True
+
+        headroom = User.personal_quota - User.used_tokens
+        pool = (
+            select(
+                User.id.label("user_id"),
+                headroom.label("headroom"),
+                func.sum(headroom).over(order_by=User.id).label("running"),
+                func.sum(headroom).over().label("total"),
+            )
+            .join(TeamMemberLink, TeamMemberLink.user_id == User.id)
+            .where(
                 TeamMemberLink.team_id == team_id,
-                TeamMemberLink.user_id == User.id,
+                User.status == UserStatus.ON_VACATION,
+                headroom > 0,
             )
-        ).all()
-
-        total_vacation_quota = sum(
-            member.personal_quota - member.used_tokens for member in vacation_members
+            .cte("vacation_pool")
+        )
+        # Headroom already claimed by members earlier in the ordering.
+        claimed = pool.c.running - pool.c.headroom
+        share = case(
+            (pool.c.running <= requested_quota, pool.c.headroom),
+            else_=requested_quota - claimed,
         )
 
-        if total_vacation_quota >= requested_quota:
-            # Allocate quota from vacation pool
-            for member in vacation_members:
-                available_quota = member.personal_quota - member.used_tokens
-                if available_quota > 0:
-                    allocation = min(available_quota, requested_quota)
-                    member.used_tokens += allocation
-                    requested_quota -= allocation
-                    self.session.add(member)
-                    if requested_quota == 0:
-                        break
-            self.session.commit()
-            return True
-        return False
+        statement = (
+            update(User)
+            .where(
+                User.id == pool.c.user_id,
+                pool.c.total >= requested_quota,
+                claimed < requested_quota,
+            )
+            .values(used_tokens=User.used_tokens + share)
+            .returning(User.id)
+            .execution_options(synchronize_session="fetch")
+        )
+        allocated = self.session.execute(statement).all()
+        if not allocated:
+            return False
+        _commit(self.session)
+        return True
 
 
 def allocate_vacation_liquidity(session: Session, user_id, team_id, requested_quota: Decimal):
@@ -106,6 +106,11 @@ approval_requests_total = Counter(
     ["status"],  # pending | approved | rejected
 )
 
+leaderboard_deltas_dropped_total = Counter(
+    "alfred_leaderboard_deltas_dropped_total",
+    "Request counters lost from a failed leaderboard write-behind flush.",
+)
+
 vacation_mode_activations = Counter(
     "alfred_vacation_mode_activations_total",
     'Volume of "Elastic Quota" transfers via vacation sharing.',
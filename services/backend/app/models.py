@@ -4,7 +4,7 @@ from decimal import Decimal
 from enum import Enum
 from typing import List, Optional
 
-from sqlalchemy import JSON, Column
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -319,7 +319,13 @@ class LeaderboardEntry(SQLModel, table=True):
     """
 
     __tablename__ = "leaderboard"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Conflict target for the per-request leaderboard upsert
+        Index("ux_leaderboard_user_period", "user_id", "period_type", "period_start", unique=True),
+        # Serves get_leaderboard's top-N (scanned backwards for the DESC sort)
+        Index("ix_leaderboard_period_score", "period_type", "period_start", "avg_efficiency_score"),
+        {"extend_existing": True},
+    )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     user_id: uuid.UUID = Field(foreign_key="users.id", index=True)
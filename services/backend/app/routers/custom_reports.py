@@ -7,12 +7,21 @@ Context: Used by frontend custom report builder and scheduler. Future: add BI in
 Model Suitability: For REST API and prototyping, GPT-4.1 is sufficient; for advanced analytics, consider Claude 3 or Gemini 1.5.
 """
 
+import logging
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Response
 
+try:
+    import redis
+    from redis import asyncio as aioredis
+except ImportError:
+    redis = None
+    aioredis = None
+
+from ..config import settings
 from ..dependencies import require_admin
 from ..schemas import (
     CustomReportCreate,
@@ -21,75 +30,205 @@ from ..schemas import (
     CustomReportRunResult,
 )
 
+logger = logging.getLogger(__name__)
+
+# Redis failures a ReportStore call recovers from; nothing to catch without redis
+_REDIS_ERRORS = (redis.RedisError,) if redis is not None else ()
+
 router = APIRouter(prefix="/v1/reports", tags=["Custom Reports"])
 
-# In-memory store for demo (replace with DB in production)
-REPORTS = {}
-RUNS = {}
+
+class ReportStore:
+    """
+    Report definitions and their runs.
+
+    Backed by Redis when the cache layer is enabled, so every worker sees the
+    same reports; otherwise kept in process memory (single worker, dev, tests).
+    All reports share one hash and each report's runs get their own, so every
+    listing is a single round trip. A Redis error on any call is logged and
+    that call is served from process memory instead.
+    """
+
+    def __init__(self, redis_client: Optional[Any] = None, key_prefix: str = "alfred:reports"):
+        self._redis = redis_client
+        self._key = key_prefix
+        self._reports: Dict[str, CustomReportResponse] = {}
+        self._runs: Dict[str, Dict[str, CustomReportRunResult]] = {}
+
+    def _runs_key(self, report_id: str) -> str:
+        return f"{self._key}:{report_id}:runs"
+
+    def _redis_failed(self, operation: str, error: Exception) -> None:
+        logger.warning(
+            f"Report store: Redis {operation} failed ({error}). Using process memory."
+        )
+
+    async def get(self, report_id: str) -> Optional[CustomReportResponse]:
+        if self._redis:
+            try:
+                raw = await self._redis.hget(self._key, report_id)
+                return CustomReportResponse.model_validate_json(raw) if raw else None
+            except _REDIS_ERRORS as e:
+                self._redis_failed("get", e)
+        return self._reports.get(report_id)
+
+    async def list(self) -> List[CustomReportResponse]:
+        if self._redis:
+            try:
+                return [
+                    CustomReportResponse.model_validate_json(raw)
+                    for raw in await self._redis.hvals(self._key)
+                ]
+            except _REDIS_ERRORS as e:
+                self._redis_failed("list", e)
+        return list(self._reports.values())
+
+    async def save(self, report: CustomReportResponse) -> None:
+        if self._redis:
+            try:
+                await self._redis.hset(self._key, report.id, report.model_dump_json())
+                return
+            except _REDIS_ERRORS as e:
+                self._redis_failed("save", e)
+        self._reports[report.id] = report
+
+    async def delete(self, report_id: str) -> None:
+        """Remove a report together with its run history."""
+        if self._redis:
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.hdel(self._key, report_id)
+                    pipe.delete(self._runs_key(report_id))
+                    await pipe.execute()
+                return
+            except _REDIS_ERRORS as e:
+                self._redis_failed("delete", e)
+        self._reports.pop(report_id, None)
+        self._runs.pop(report_id, None)
+
+    async def record_run(self, report: CustomReportResponse, run: CustomReportRunResult) -> None:
+        """Store a run and the report's updated ``last_run`` together."""
+        if self._redis:
+            try:
+                async with self._redis.pipeline(transaction=True) as pipe:
+                    pipe.hset(self._runs_key(report.id), run.run_id, run.model_dump_json())
+                    pipe.hset(self._key, report.id, report.model_dump_json())
+                    await pipe.execute()
+                return
+            except _REDIS_ERRORS as e:
+                self._redis_failed("record_run", e)
+        self._runs.setdefault(report.id, {})[run.run_id] = run
+        self._reports[report.id] = report
+
+    async def list_runs(self, report_id: str) -> List[CustomReportRunResult]:
+        if self._redis:
+            try:
+                return [
+                    CustomReportRunResult.model_validate_json(raw)
+                    for raw in await self._redis.hvals(self._runs_key(report_id))
+                ]
+            except _REDIS_ERRORS as e:
+                self._redis_failed("list_runs", e)
+        return list(self._runs.get(report_id, {}).values())
+
+
+store = ReportStore()
+
+
+async def connect_report_store() -> None:
+    """
+    Move the report store onto Redis; called from the app lifespan.
+
+    Same fast-fail policy as CacheManager: 2s timeouts and a heartbeat,
+    keeping reports in process memory when Redis is unreachable.
+    """
+    if not settings.redis_enabled or aioredis is None:
+        return
+    client = aioredis.Redis(
+        host=settings.redis_host,
+        port=settings.redis_port,
+        db=settings.redis_db,
+        socket_connect_timeout=2,  # Fast fail on connect
+        socket_timeout=2,  # Fast fail on command
+    )
+    try:
+        await client.ping()
+    except Exception as e:
+        logger.warning(
+            f"Report store: Redis connection failed ({e}). Keeping reports in process memory."
+        )
+        await client.connection_pool.disconnect()
+        return
+    store._redis = client
+
+
+async def close_report_store() -> None:
+    """Release the report store's Redis connections on shutdown."""
+    if store._redis is not None:
+        await store._redis.connection_pool.disconnect()
 
 
 @router.post("/", response_model=CustomReportResponse, dependencies=[Depends(require_admin)])
-def create_report(report: CustomReportCreate):
-    rid = str(uuid4())
-    now = datetime.utcnow()
-    REPORTS[rid] = {
-        "id": rid,
-        "name": report.name,
-        "description": report.description,
-        "query": report.query,
-        "schedule": report.schedule,
-        "format": report.format,
-        "recipients": report.recipients,
-        "created_at": now,
-        "last_run": None,
-        "status": "idle",
-    }
-    return CustomReportResponse(**REPORTS[rid])
+async def create_report(report: CustomReportCreate):
+    created = CustomReportResponse(
+        id=str(uuid4()),
+        name=report.name,
+        description=report.description,
+        query=report.query,
+        schedule=report.schedule,
+        format=report.format,
+        recipients=report.recipients,
+        created_at=datetime.utcnow(),
+        last_run=None,
+        status="idle",
+    )
+    await store.save(created)
+    return created
 
 
 @router.get("/", response_model=List[CustomReportResponse], dependencies=[Depends(require_admin)])
-def list_reports():
-    return [CustomReportResponse(**r) for r in REPORTS.values()]
+async def list_reports():
+    return await store.list()
 
 
 @router.post(
     "/{report_id}/run", response_model=CustomReportRunResult, dependencies=[Depends(require_admin)]
 )
-def run_report(report_id: str, req: CustomReportRunRequest):
-    if report_id not in REPORTS:
+async def run_report(report_id: str, req: CustomReportRunRequest):
+    report = await store.get(report_id)
+    if report is None:
         raise HTTPException(status_code=404, detail="Report not found")
     run_id = str(uuid4())
     now = datetime.utcnow()
     # Simulate report execution (replace with real logic)
-    output_url = (
-        f"/static/reports/{report_id}_{run_id}.{req.format or REPORTS[report_id]['format']}"
+    fmt = (req.format or report.format).value
+    run = CustomReportRunResult(
+        report_id=report_id,
+        run_id=run_id,
+        status="completed",
+        output_url=f"/static/reports/{report_id}_{run_id}.{fmt}",
+        started_at=now,
+        finished_at=now,
+        error=None,
     )
-    RUNS[run_id] = {
-        "report_id": report_id,
-        "run_id": run_id,
-        "status": "completed",
-        "output_url": output_url,
-        "started_at": now,
-        "finished_at": now,
-        "error": None,
-    }
-    REPORTS[report_id]["last_run"] = now
-    return CustomReportRunResult(**RUNS[run_id])
+    report.last_run = now
+    await store.record_run(report, run)
+    return run
 
 
 @router.get(
     "/{report_id}", response_model=CustomReportResponse, dependencies=[Depends(require_admin)]
 )
-def get_report(report_id: str):
-    if report_id not in REPORTS:
+async def get_report(report_id: str):
+    report = await store.get(report_id)
+    if report is None:
         raise HTTPException(status_code=404, detail="Report not found")
-    return CustomReportResponse(**REPORTS[report_id])
+    return report
 
 
 @router.delete("/{report_id}", status_code=204, dependencies=[Depends(require_admin)])
-def delete_report(report_id: str):
-    if report_id in REPORTS:
-        del REPORTS[report_id]
+async def delete_report(report_id: str):
+    await store.delete(report_id)
     return Response(status_code=204)
 
 
@@ -98,5 +237,5 @@ def delete_report(report_id: str):
     response_model=List[CustomReportRunResult],
     dependencies=[Depends(require_admin)],
 )
-def list_report_runs(report_id: str):
-    return [CustomReportRunResult(**r) for r in RUNS.values() if r["report_id"] == report_id]
+async def list_report_runs(report_id: str):
+    return await store.list_runs(report_id)
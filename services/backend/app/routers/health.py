@@ -1,20 +1,23 @@
 """
 """
 
-from typing import Any
+import json
 
 from app.config import settings
 from app.database import get_db_session
 from app.models import User  # type: ignore
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlmodel import Session, select
 
 router = APIRouter()
 
+# Liveness probes hit this constantly and the payload never changes: encode once.
+_HEALTH_BODY = json.dumps({"status": "healthy", "version": settings.app_version}).encode()
+
 
 @router.get("/health")
-def health() -> Any:
-    return {"status": "healthy", "version": settings.app_version}
+async def health() -> Response:
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 
 @router.get("/test/users_count")
@@ -11,6 +11,8 @@ Detects Personally Identifiable Information (PII) in prompts:
 - Dates of Birth
 
 Uses regex patterns with optional Presidio integration for advanced NER-based detection.
+When google-re2 is installed, patterns run on RE2's linear-time automaton instead
+of the backtracking stdlib engine.
 """
 
 import logging
@@ -19,9 +21,26 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import re2
+except ImportError:
+    # google-re2 is an optional speedup; fall back to the stdlib engine.
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
 
+def _compile(pattern: str):
+    """Compile a case-insensitive pattern, preferring RE2 when available."""
+    if re2 is not None:
+        try:
+            return re2.compile("(?i)" + pattern)
+        except re2.error:
+            # Construct RE2 does not support (e.g. backreferences): use stdlib
+            pass
+    return re.compile(pattern, re.IGNORECASE)
+
+
 class PIIType(str, Enum):
     """Types of PII that can be detected."""
 
@@ -127,19 +146,17 @@ class PIIDetector:
         for pii_type in self.enabled_types:
             if pii_type in self.PATTERNS:
                 pattern, _ = self.PATTERNS[pii_type]
-                self._compiled_patterns[pii_type] = re.compile(pattern, re.IGNORECASE)
+                self._compiled_patterns[pii_type] = _compile(pattern)
 
         # Add address pattern
         if PIIType.ADDRESS in self.enabled_types:
-            self._compiled_patterns[PIIType.ADDRESS] = re.compile(
-                self.ADDRESS_PATTERN, re.IGNORECASE
-            )
+            self._compiled_patterns[PIIType.ADDRESS] = _compile(self.ADDRESS_PATTERN)
 
         # Compile custom patterns
         self._custom_compiled: Dict[str, re.Pattern] = {}
         for name, pattern in self.custom_patterns.items():
             try:
-                self._custom_compiled[name] = re.compile(pattern, re.IGNORECASE)
+                self._custom_compiled[name] = _compile(pattern)
             except re.error as e:
                 logger.warning(f"Invalid custom pattern '{name}': {e}")
 
@@ -0,0 +1,30 @@
+"""
+Alembic migration: composite index for leaderboard reads
+
+Adds (period_type, period_start, avg_efficiency_score) so the top-N query
+in get_leaderboard is an index range scan instead of a sort over every
+entry in the period. B-tree indexes scan in either direction, so the same
+index serves the DESC ordering.
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_add_leaderboard_score_index"
+down_revision = "20261017_add_leaderboard_upsert_key"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_leaderboard_period_score",
+        "leaderboard",
+        ["period_type", "period_start", "avg_efficiency_score"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_leaderboard_period_score", table_name="leaderboard")
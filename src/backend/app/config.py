@@ -56,6 +56,9 @@ class Settings(BaseSettings):
     )
     host: str = Field(default="0.0.0.0", description="The interface to bind the server to")
     port: int = Field(default=8000, ge=1, le=65535, description="TCP port for the application")
+    root_path: str = Field(
+        default="", description="Path prefix stripped by a fronting reverse proxy (ASGI root_path)"
+    )
     workers: int = Field(
         default=4, ge=1, description="Number of worker processes for production concurrency"
     )
@@ -174,6 +177,10 @@ class Settings(BaseSettings):
     log_file: Optional[str] = Field(
         default=None, description="File path for logs (Leave None for container logs to stdout)"
     )
+    metrics_enabled: Optional[bool] = Field(
+        default=None,
+        description="Prometheus request instrumentation and /metrics (None: on unless testing)",
+    )
 
     # --- Privacy Assurance ---
     force_strict_privacy: bool = Field(
@@ -205,6 +212,14 @@ class Settings(BaseSettings):
         default=None, description="Teams alerts connector URL"
     )
 
+    # --- Notification Hub: Outbound Webhook ---
+    webhook_url: Optional[str] = Field(
+        default=None, description="Generic HTTP endpoint for signed event payloads"
+    )
+    webhook_secret: Optional[str] = Field(
+        default=None, description="HMAC-SHA256 secret for the X-Alfred-Signature header"
+    )
+
     # --- Notification Hub: Telegram ---
     telegram_bot_token: Optional[str] = Field(default=None, description="API token from @BotFather")
     telegram_chat_id: Optional[str] = Field(default=None, description="Default chat/group ID")
@@ -246,6 +261,13 @@ class Settings(BaseSettings):
     redis_port: int = Field(default=6379, description="Redis server port")
     redis_db: int = Field(default=0, description="Logical database index")
     redis_url: str = "redis://localhost:6379/0"  # Default Redis URL for local development
+    redis_pool_size: int = Field(
+        default=100, ge=1, description="Max pooled connections for the Redis rate limiter"
+    )
+    redis_unix_socket: Optional[str] = Field(
+        default=None,
+        description="Unix socket of a co-located Redis; used by the rate limiter instead of redis_url",
+    )
     notify_on_approval_request: bool = Field(
         default=True, description="Notify admins of pending quota requests"
     )
@@ -532,6 +554,13 @@ class Settings(BaseSettings):
         """Utility for development-only features."""
         return self.environment == "development"
 
+    @property
+    def enable_metrics(self) -> bool:
+        """Request instrumentation switch; test runs skip it unless asked."""
+        if self.metrics_enabled is not None:
+            return self.metrics_enabled
+        return self.environment != "test"
+
     @property
     def is_sqlite(self) -> bool:
         """Automatic driver detection."""
@@ -542,6 +571,13 @@ class Settings(BaseSettings):
         """Format for compatibility with SlowAPI/Limiter."""
         return f"{self.rate_limit_requests}/{self.rate_limit_window_seconds}seconds"
 
+    @property
+    def effective_cors_origins(self) -> List[str]:
+        """CORS allow-list for this environment; wildcards never reach production."""
+        if self.is_production:
+            return [o for o in self.cors_origins if o != "*"]
+        return self.cors_origins
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -4,11 +4,41 @@ Send notifications to Slack via webhooks or Bot API.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import json
+from itertools import islice
+from typing import Any, ClassVar, Dict, List, Optional
 
 import httpx
 
-from .base import EventType, NotificationEvent, NotificationProvider
+from .base import (
+    AdmissionController,
+    EventType,
+    NotificationEvent,
+    NotificationProvider,
+    TokenBucket,
+    parse_retry_after,
+)
+
+# Block Kit skeletons shared by every payload. Built once at import and never
+# handed out: _build_blocks copies each one before adding it to a payload.
+_HEADER_SKELETON: Dict[str, Any] = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "", "emoji": True},
+}
+_SECTION_SKELETON: Dict[str, Any] = {"type": "section", "text": {"type": "mrkdwn", "text": ""}}
+_DIVIDER_BLOCK: Dict[str, Any] = {"type": "divider"}
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Turns data keys like "tokens_used" into "tokens used" before title-casing
+_UNDERSCORE_TO_SPACE = str.maketrans("_", " ")
+
+
+def _patch_text(skeleton: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """Copy a text-bearing block skeleton and fill in its text."""
+    block = skeleton.copy()
+    block["text"] = {**skeleton["text"], "text": text}
+    return block
 
 
 class SlackNotifier(NotificationProvider):
@@ -27,6 +57,14 @@ class SlackNotifier(NotificationProvider):
         SLACK_BOT_TOKEN: Bot token for advanced features (optional)
     """
 
+    # Delivery attempts per event; 429s honor Retry-After, 5xx back off
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF_BASE = 0.5
+
+    # Process-wide HTTP/2 client shared by every SlackNotifier instance so
+    # webhook POSTs reuse pooled TLS connections instead of re-handshaking.
+    _shared_client: ClassVar[Optional[httpx.AsyncClient]] = None
+
     # Severity to emoji mapping
     SEVERITY_EMOJI = {
         "info": ":information_source:",
@@ -61,6 +99,9 @@ class SlackNotifier(NotificationProvider):
         bot_token: Optional[str] = None,
         default_channel: Optional[str] = None,
         timeout: float = 10.0,
+        rate_limit_per_second: float = 1.0,
+        rate_limit_burst: int = 1,
+        max_concurrency: int = 64,
     ):
         """
         Initialize Slack notifier.
@@ -70,14 +111,24 @@ class SlackNotifier(NotificationProvider):
             alerts_webhook_url: Separate webhook for critical alerts
             bot_token: Slack bot token (for chat.postMessage API)
             default_channel: Default channel for bot posts
-            timeout: HTTP request timeout in seconds
+            timeout: HTTP read timeout in seconds. Connect, write and pool
+                waits have their own short bounds so connection trouble
+                fails fast instead of consuming the whole budget.
+            rate_limit_per_second: Sustained messages per second per webhook
+                (Slack allows roughly one per second)
+            rate_limit_burst: Messages a webhook may send back-to-back
+            max_concurrency: Max sends in flight at once from send_batch
         """
         self.webhook_url = webhook_url
         self.alerts_webhook_url = alerts_webhook_url
         self.bot_token = bot_token
         self.default_channel = default_channel
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._http_timeout = httpx.Timeout(connect=2.0, read=timeout, write=5.0, pool=1.0)
+        self.rate_limit_per_second = rate_limit_per_second
+        self.rate_limit_burst = rate_limit_burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._admission = AdmissionController(max_concurrency)
 
     @property
     def name(self) -> str:
@@ -88,15 +139,30 @@ class SlackNotifier(NotificationProvider):
         return bool(self.webhook_url or self.bot_token)
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
-        if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
-        return self._client
+        """Get the shared HTTP client."""
+        return await self._ensure_client(self._http_timeout)
+
+    @classmethod
+    async def _ensure_client(cls, timeout: httpx.Timeout) -> httpx.AsyncClient:
+        """Create the shared HTTP client on first use (or after shutdown)."""
+        if cls._shared_client is None or cls._shared_client.is_closed:
+            cls._shared_client = httpx.AsyncClient(
+                http2=True,
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=64,
+                    max_connections=64,
+                    keepalive_expiry=30,
+                ),
+            )
+        return cls._shared_client
 
-    async def close(self) -> None:
-        """Close HTTP client."""
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+    @classmethod
+    async def close_shared_client(cls) -> None:
+        """Close the shared HTTP client. Called once at application shutdown."""
+        if cls._shared_client and not cls._shared_client.is_closed:
+            await cls._shared_client.aclose()
+        cls._shared_client = None
 
     def _get_webhook_for_event(self, event: NotificationEvent) -> Optional[str]:
         """Determine which webhook to use based on event severity."""
@@ -104,53 +170,67 @@ class SlackNotifier(NotificationProvider):
             return self.alerts_webhook_url
         return self.webhook_url
 
+    def _get_bucket(self, webhook_url: str) -> TokenBucket:
+        """Get or create the rate limiter for a webhook URL."""
+        bucket = self._buckets.get(webhook_url)
+        if bucket is None:
+            bucket = TokenBucket(self.rate_limit_burst, self.rate_limit_per_second)
+            self._buckets[webhook_url] = bucket
+        return bucket
+
     def _build_blocks(self, event: NotificationEvent) -> List[Dict[str, Any]]:
         """Build Slack Block Kit blocks for rich formatting."""
         emoji = self.SEVERITY_EMOJI.get(event.severity, ":bell:")
 
         blocks = [
-            {
-                "type": "header",
-                "text": {"type": "plain_text", "text": f"{emoji} {event.title}", "emoji": True},
-            },
-            {"type": "section", "text": {"type": "mrkdwn", "text": event.message}},
+            _patch_text(_HEADER_SKELETON, f"{emoji} {event.title}"),
+            _patch_text(_SECTION_SKELETON, event.message),
         ]
 
-        # Add context fields
-        context_elements = []
-
-        if event.user_name:
-            context_elements.append(
-                {"type": "mrkdwn", "text": f":bust_in_silhouette: *User:* {event.user_name}"}
+        # Fields read more than once are bound to locals up front
+        user_name = event.user_name
+        team_name = event.team_name
+        data = event.data
+
+        # Add context fields. The timestamp element is always present, so the
+        # context block is always emitted and the list is built in one pass.
+        context_elements = [
+            element
+            for element in (
+                (
+                    {"type": "mrkdwn", "text": f":bust_in_silhouette: *User:* {user_name}"}
+                    if user_name
+                    else None
+                ),
+                (
+                    {"type": "mrkdwn", "text": f":busts_in_silhouette: *Team:* {team_name}"}
+                    if team_name
+                    else None
+                ),
+                {"type": "mrkdwn", "text": f":clock1: {event.timestamp:%Y-%m-%d %H:%M} UTC"},
             )
+            if element is not None
+        ]
+        blocks.append({"type": "context", "elements": context_elements})
 
-        if event.team_name:
-            context_elements.append(
-                {"type": "mrkdwn", "text": f":busts_in_silhouette: *Team:* {event.team_name}"}
+        # Add data fields if present
+        if data:
+            fields = (
+                {
+                    "type": "mrkdwn",
+                    "text": f"*{key.translate(_UNDERSCORE_TO_SPACE).title()}:*\n{value}",
+                }
+                for key, value in islice(data.items(), 10)  # Limit to 10 fields
             )
 
-        context_elements.append(
-            {"type": "mrkdwn", "text": f":clock1: {event.timestamp.strftime('%Y-%m-%d %H:%M UTC')}"}
-        )
-
-        if context_elements:
-            blocks.append({"type": "context", "elements": context_elements})
-
-        # Add data fields if present
-        if event.data:
-            fields = []
-            for key, value in list(event.data.items())[:10]:  # Limit to 10 fields
-                fields.append(
-                    {"type": "mrkdwn", "text": f"*{key.replace('_', ' ').title()}:*\n{value}"}
-                )
-
-            # Split fields into groups of 2 for side-by-side display
-            for i in range(0, len(fields), 2):
-                section_fields = fields[i : i + 2]
+            # Pair fields up for side-by-side display
+            for first in fields:
+                second = next(fields, None)
+                section_fields = [first] if second is None else [first, second]
                 blocks.append({"type": "section", "fields": section_fields})
 
         # Add divider at the end
-        blocks.append({"type": "divider"})
+        blocks.append(_DIVIDER_BLOCK.copy())
 
         return blocks
 
@@ -163,14 +243,18 @@ class SlackNotifier(NotificationProvider):
             "blocks": blocks,
             "attachments": [
                 {
-                    "footer": f"Alfred | Event ID: {event.event_id[:8]}",
-                    "ts": int(event.timestamp.timestamp()),
+                    "footer": f"Alfred | Event ID: {event.short_id}",
+                    "ts": event.ts_epoch,
                 }
             ],
         }
 
         return payload
 
+    def _serialize_payload(self, event: NotificationEvent) -> bytes:
+        """Build and encode the webhook payload once, ready to POST verbatim."""
+        return json.dumps(self._build_payload(event), separators=(",", ":")).encode("utf-8")
+
     async def send(self, event: NotificationEvent) -> bool:
         """Send a notification to Slack."""
         if not self.is_configured:
@@ -182,11 +266,37 @@ class SlackNotifier(NotificationProvider):
 
         try:
             client = await self._get_client()
-            payload = self._build_payload(event)
-
-            response = await client.post(webhook_url, json=payload)
+            payload_bytes = self._serialize_payload(event)
+
+            for attempt in range(self.MAX_ATTEMPTS):
+                try:
+                    response = await client.post(
+                        webhook_url,
+                        content=payload_bytes,
+                        headers=_JSON_HEADERS,
+                        timeout=self._http_timeout,
+                    )
+                except httpx.TransportError:
+                    response = None
+
+                if response is not None:
+                    if response.status_code == 200:
+                        return True
+                    # Client errors other than rate limiting won't succeed on retry
+                    if response.status_code < 500 and response.status_code != 429:
+                        return False
+
+                if attempt + 1 == self.MAX_ATTEMPTS:
+                    break
+
+                if response is not None and response.status_code == 429:
+                    delay = parse_retry_after(response.headers.get("Retry-After"))
+                else:
+                    # Transient 5xx or connection failure: exponential backoff
+                    delay = self.RETRY_BACKOFF_BASE * (2**attempt)
+                await asyncio.sleep(delay)
 
-            return response.status_code == 200
+            return False
 
         except Exception:
             # Log error but don't raise - notifications shouldn't break main flow
@@ -194,14 +304,22 @@ class SlackNotifier(NotificationProvider):
 
     async def send_batch(self, events: List[NotificationEvent]) -> Dict[str, bool]:
         """Send multiple notifications to Slack."""
-        results = {}
-
-        # Send sequentially to respect rate limits
-        for event in events:
-            results[event.event_id] = await self.send(event)
-            await asyncio.sleep(0.1)  # Small delay to avoid rate limiting
 
-        return results
+        async def _send_throttled(event: NotificationEvent) -> bool:
+            # Each webhook has its own budget, so events bound for different
+            # webhooks are sent concurrently while each stays under its limit.
+            webhook_url = self._get_webhook_for_event(event)
+            if webhook_url:
+                await self._get_bucket(webhook_url).acquire()
+            async with self._admission:
+                return await self.send(event)
+
+        # send() is stateless beyond the shared client, so sends can overlap;
+        # one failing coroutine must not cancel or hide the others' results.
+        results = await asyncio.gather(
+            *(_send_throttled(e) for e in events), return_exceptions=True
+        )
+        return {event.event_id: result is True for event, result in zip(events, results)}
 
     def format_message(self, event: NotificationEvent) -> str:
         """Format message with Slack mrkdwn syntax."""
@@ -4,6 +4,7 @@ Send notifications to Teams via Incoming Webhooks with Adaptive Cards.
 """
 
 import asyncio
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
 import httpx
@@ -53,6 +54,9 @@ class TeamsNotifier(NotificationProvider):
         EventType.HIGH_LATENCY: "🐢",
     }
 
+    # Icon lookup with the generic fallback baked in, shared by every builder
+    _ICON_BY_EVENT = defaultdict(lambda: "📢", EVENT_ICONS)
+
     def __init__(
         self,
         webhook_url: Optional[str] = None,
@@ -99,7 +103,7 @@ class TeamsNotifier(NotificationProvider):
 
     def _build_adaptive_card(self, event: NotificationEvent) -> Dict[str, Any]:
         """Build an Adaptive Card for Teams."""
-        icon = self.EVENT_ICONS.get(event.event_type, "📢")
+        icon = self._ICON_BY_EVENT[event.event_type]
         # Build the card body
         body = [
             {
@@ -148,7 +152,7 @@ class TeamsNotifier(NotificationProvider):
         body.append(
             {
                 "type": "TextBlock",
-                "text": f"Event ID: {event.event_id[:8]} | Alfred",
+                "text": f"Event ID: {event.short_id} | Alfred",
                 "size": "small",
                 "isSubtle": True,
                 "spacing": "large",
@@ -187,7 +191,7 @@ class TeamsNotifier(NotificationProvider):
 
     def _build_legacy_payload(self, event: NotificationEvent) -> Dict[str, Any]:
         """Build a legacy MessageCard payload (fallback for older connectors)."""
-        icon = self.EVENT_ICONS.get(event.event_type, "📢")
+        icon = self._ICON_BY_EVENT[event.event_type]
 
         sections = [
             {
@@ -265,7 +269,7 @@ class TeamsNotifier(NotificationProvider):
 
     def format_message(self, event: NotificationEvent) -> str:
         """Format message for Teams (Markdown-like syntax)."""
-        icon = self.EVENT_ICONS.get(event.event_type, "📢")
+        icon = self._ICON_BY_EVENT[event.event_type]
         lines = [
             f"**{icon} {event.title}**",
             "",
@@ -184,7 +184,7 @@ class TelegramNotifier(NotificationProvider):
         # Footer
         lines.append("")
         timestamp = event.timestamp.strftime("%Y\\-%m\\-%d %H:%M UTC")
-        event_id = self._escape_markdown(event.event_id[:8])
+        event_id = self._escape_markdown(event.short_id)
         lines.append(f"_{severity_emoji} {event.severity.upper()} \\| {timestamp}_")
         lines.append(f"_Alfred \\| Event: {event_id}_")
 
@@ -217,7 +217,7 @@ class TelegramNotifier(NotificationProvider):
         lines.append("")
         timestamp = event.timestamp.strftime("%Y-%m-%d %H:%M UTC")
         lines.append(f"<i>{severity_emoji} {event.severity.upper()} | {timestamp}</i>")
-        lines.append(f"<i>Alfred | Event: {event.event_id[:8]}</i>")
+        lines.append(f"<i>Alfred | Event: {event.short_id}</i>")
 
         return "\n".join(lines)
 
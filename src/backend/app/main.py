@@ -9,15 +9,16 @@ application-wide middleware and lifespan events.
 
 """
 
+import hashlib
 import importlib
 import os
 from types import ModuleType
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
-from redis.asyncio import Redis
+from redis import ConnectionPool, UnixDomainSocketConnection
 from slowapi import Limiter
 from slowapi.middleware import SlowAPIMiddleware
 from slowapi.util import get_remote_address
@@ -38,23 +39,83 @@ get_session = get_db_session
 # are skipped and logged at debug level. This improves cold-start time and
 # avoids importing large optional dependencies during test runs.
 
+logger = get_logger(__name__)
+
 
 def _import_module(module_name: str) -> ModuleType | None:
     try:
         return importlib.import_module(module_name)
     except Exception as e:
-        logger = get_logger(__name__)
         logger.debug("Optional router module '%s' not available: %s", module_name, e)
         return None
 
 
+_PACKAGE = __package__ or "app"
+
+# Router modules in registration order (route precedence follows this order),
+# grouped by business domain. Paths are resolved against this package once,
+# at import time.
+_ROUTERS = tuple(
+    (f"{_PACKAGE}.{name}", tag)
+    for name, tag in (
+        # Core Identity & Access Management
+        ("routers.users", "Identity & Access Management"),
+        ("routers.health", "Health"),
+        ("routers.teams", "Teams & Collaboration"),
+        ("routers.auth", "Authentication"),
+        # Governance & Credit Management
+        ("routers.governance", "Governance & Credit Reallocation"),
+        ("routers.wallets", "Wallet & Credit Management"),
+        ("routers.transfers", "Budget Transfer Workflow"),
+        # Analytics & Reporting
+        ("dashboard", "Dashboard & Analytics"),
+        ("routers.usage_analytics", "Usage Analytics"),
+        ("routers.custom_reports", "Custom Reports"),
+        ("routers.data_export", "Data Export"),
+        ("routers.analytics", "Real-Time & Historical Analytics"),
+        # Administration & Configuration
+        ("routers.admin_config", "Admin Configuration"),
+        ("routers.audit_log", "Audit Logging"),
+        ("routers.rbac", "Role-Based Access Control"),
+        ("routers.notifications", "Notifications"),
+        ("routers.import_export", "Import/Export"),
+        ("routers.metrics", "Metrics"),
+        # Data Management & Quality
+        ("routers.data_access", "Data Access Controls"),
+        ("routers.data_anonymization", "Data Anonymization & Masking"),
+        ("routers.alerting", "Alerting & Anomaly Detection"),
+        ("routers.sharing", "Collaboration & Sharing"),
+        ("routers.data_prep", "Data Preparation & Transformation"),
+        ("routers.query_validation", "Advanced Query Validation & BI Integration"),
+        ("routers.report_audit", "Audit Logging & Permission Checks"),
+        ("routers.data_quality", "Data Quality Monitoring"),
+        ("routers.data_lineage", "Data Lineage & Provenance"),
+        ("routers.data_catalog", "Data Catalog & Metadata Management"),
+        ("routers.data_enrichment", "Data Enrichment Pipelines"),
+        ("routers.data_governance", "Data Governance & Stewardship"),
+        # External Integrations
+        ("routers.bi_connectors", "BI Tools Integration"),
+        ("routers.compliance", "Compliance"),
+        ("routers.slack_app", "Slack App"),
+        ("routers.sso_rbac", "SSO & RBAC"),
+        ("routers.scim", "SCIM 2.0 Provisioning"),
+        ("routers.gdpr", "GDPR Compliance"),
+        ("routers.prompts", "Prompt Registry"),
+        ("routers.finops", "FinOps Integrations"),
+        # Core API Gateway
+        ("routers.proxy", "AI Gateway"),
+        # Onboarding & Documentation
+        ("routers.gitops_onboarding", "Onboarding & GitOps Docs"),
+    )
+)
+
+
 setup_logging(
     log_level=settings.log_level,
     log_format=settings.log_format,
     mask_pii=settings.mask_pii_in_logs,
     log_file=settings.log_file,
 )
-logger = get_logger(__name__)
 
 
 try:
@@ -63,6 +124,19 @@ except Exception:
     Instrumentator = None
 
 
+# Explicit CORS allow-lists: Starlette precomputes the preflight headers once
+# instead of echoing whatever a preflight asks for.
+_CORS_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+_CORS_HEADERS = (
+    "Authorization",
+    "Content-Type",
+    "X-API-Key",
+    "X-Request-ID",
+    "X-Privacy-Mode",
+    "X-Project-Priority",
+)
+
+
 if not hasattr(settings, "redis_url"):
     raise AttributeError("The 'redis_url' attribute is missing in settings. Please define it.")
 
@@ -90,22 +164,59 @@ def create_app(engine=None) -> FastAPI:
         description="Enterprise Multi-LLM Gateway with B2B Quota Governance",
         version=settings.app_version,
         lifespan=alfred_lifespan,
+        root_path=settings.root_path,
         docs_url="/docs" if not settings.is_production else None,
         redoc_url="/redoc" if not settings.is_production else None,
     )
 
-    # Setup Redis-backed rate limiting (best-effort)
+    # Setup Redis-backed rate limiting (best-effort). The pool and storage
+    # connect lazily, so a Redis outage only surfaces on the first request;
+    # SlowAPI's in-memory fallback covers that at request time, and the except
+    # branch below only covers errors while building the limiter itself.
     try:
-        Redis.from_url(settings.redis_url)
-        limiter = Limiter(key_func=get_remote_address, storage_uri=settings.redis_url)
+        # One bounded pool for the limiter's storage instead of ad-hoc clients;
+        # SlowAPI's storage backend is synchronous, so the pool is too.
+        if settings.redis_unix_socket:
+            # Co-located Redis (e.g. a sidecar): skip the TCP stack entirely.
+            redis_pool = ConnectionPool(
+                connection_class=UnixDomainSocketConnection,
+                path=settings.redis_unix_socket,
+                db=settings.redis_db,
+                max_connections=settings.redis_pool_size,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            storage_uri = f"redis+unix://{settings.redis_unix_socket}"
+        else:
+            redis_pool = ConnectionPool.from_url(
+                settings.redis_url,
+                max_connections=settings.redis_pool_size,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+            storage_uri = settings.redis_url
+        limiter = Limiter(
+            key_func=get_remote_address,
+            storage_uri=storage_uri,
+            storage_options={"connection_pool": redis_pool},
+            # Redis unreachable at request time: keep enforcing per-process
+            # limits instead of failing the request.
+            in_memory_fallback=[settings.rate_limit_string],
+            swallow_errors=True,
+        )
         app.state.limiter = limiter
+        app.state.redis_pool = redis_pool
         app.add_middleware(SlowAPIMiddleware)
         logger.info("Redis-backed distributed rate limiting enabled.")
     except Exception as e:
-        logger.error(f"Failed to initialize Redis-backed rate limiting: {e}")
+        logger.error("Failed to initialize Redis-backed rate limiting: %s", e)
+        # Degrade to per-process limits rather than dropping rate limiting.
+        app.state.limiter = Limiter(key_func=get_remote_address, storage_uri="memory://")
+        app.add_middleware(SlowAPIMiddleware)
+        logger.warning("Rate limiting falling back to in-memory storage.")
 
     # Optional Prometheus instrumentation
-    if Instrumentator is not None:
+    if Instrumentator is not None and settings.enable_metrics:
         try:
             instrumentator = Instrumentator(
                 should_group_status_codes=False,
@@ -122,17 +233,12 @@ def create_app(engine=None) -> FastAPI:
     setup_middleware(app)
 
     # Configure CORS
-    cors_origins = (
-        [o for o in settings.cors_origins if o != "*"]
-        if settings.is_production
-        else settings.cors_origins
-    )
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=cors_origins or ["api.alfred.enterprise"],
+        allow_origins=settings.effective_cors_origins or ["api.alfred.enterprise"],
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=_CORS_METHODS,
+        allow_headers=_CORS_HEADERS,
     )
     # Register routers and return the configured app
     register_routers(app)
@@ -157,109 +263,20 @@ def register_routers(app: FastAPI):
     """
     Register all API routers in a modular, categorized way.
 
-    This function organizes routers by business domain for better maintainability
-    and makes it easier to add new routers to appropriate categories.
+    Routers are listed by business domain in `_ROUTERS`; add new routers to the
+    appropriate category there.
     """
-    # Core Identity & Access Management
-    identity_routers = [
-        ("routers.users", "Identity & Access Management"),
-        ("routers.health", "Health"),
-        ("routers.teams", "Teams & Collaboration"),
-        ("routers.auth", "Authentication"),
-    ]
-
-    # Governance & Credit Management
-    governance_routers = [
-        ("routers.governance", "Governance & Credit Reallocation"),
-        ("routers.wallets", "Wallet & Credit Management"),
-        ("routers.transfers", "Budget Transfer Workflow"),
-    ]
-    # Alias router handled below if present on module
-
-    # Analytics & Reporting
-    analytics_routers = [
-        ("dashboard", "Dashboard & Analytics"),
-        ("routers.usage_analytics", "Usage Analytics"),
-        ("routers.custom_reports", "Custom Reports"),
-        ("routers.data_export", "Data Export"),
-        ("routers.analytics", "Real-Time & Historical Analytics"),
-    ]
-
-    # Administration & Configuration
-    admin_routers = [
-        ("routers.admin_config", "Admin Configuration"),
-        ("routers.audit_log", "Audit Logging"),
-        ("routers.rbac", "Role-Based Access Control"),
-        ("routers.notifications", "Notifications"),
-        ("routers.import_export", "Import/Export"),
-        ("routers.metrics", "Metrics"),
-    ]
-
-    # Data Management & Quality
-    data_routers = [
-        ("routers.data_access", "Data Access Controls"),
-        ("routers.data_anonymization", "Data Anonymization & Masking"),
-        ("routers.alerting", "Alerting & Anomaly Detection"),
-        ("routers.sharing", "Collaboration & Sharing"),
-        ("routers.data_prep", "Data Preparation & Transformation"),
-        ("routers.query_validation", "Advanced Query Validation & BI Integration"),
-        ("routers.report_audit", "Audit Logging & Permission Checks"),
-        ("routers.data_quality", "Data Quality Monitoring"),
-        ("routers.data_lineage", "Data Lineage & Provenance"),
-        ("routers.data_catalog", "Data Catalog & Metadata Management"),
-        ("routers.data_enrichment", "Data Enrichment Pipelines"),
-        ("routers.data_governance", "Data Governance & Stewardship"),
-    ]
-
-    # External Integrations
-    integration_routers = [
-        ("routers.bi_connectors", "BI Tools Integration"),
-        ("routers.compliance", "Compliance"),
-        ("routers.slack_app", "Slack App"),
-        ("routers.sso_rbac", "SSO & RBAC"),
-        ("routers.scim", "SCIM 2.0 Provisioning"),
-        ("routers.gdpr", "GDPR Compliance"),
-        ("routers.prompts", "Prompt Registry"),
-        ("routers.finops", "FinOps Integrations"),
-    ]
-
-    # Core API Gateway
-    gateway_routers = [
-        ("routers.proxy", "AI Gateway"),
-    ]
-
-    # Onboarding & Documentation
-    onboarding_routers = [
-        ("routers.gitops_onboarding", "Onboarding & GitOps Docs"),
-    ]
-
-    # Register all router categories
-    all_router_categories = [
-        identity_routers,
-        governance_routers,
-        analytics_routers,
-        admin_routers,
-        data_routers,
-        integration_routers,
-        gateway_routers,
-        onboarding_routers,
-    ]
-
-    # Resolve module paths relative to this package (e.g. 'app.routers.<name>').
-    pkg = __package__ or "app"
-
-    def _resolve_and_include(item, tag: str):
-        # item may be a module path (e.g. 'routers.users') or a module name
-        mod_path = item if item.startswith(".") or item.startswith(pkg) else f"{pkg}.{item}"
+    def _resolve_and_include(mod_path: str, tag: str):
         mod = _import_module(mod_path)
         if not mod:
             return
 
         # Prefer `.router` attribute; fallback to `_alias_router` or module-level `include`.
+        namespace = vars(mod)
         router_obj = (
-            getattr(mod, "router", None)
-            or getattr(mod, "_alias_router", None)
-            or getattr(mod, "include", None)
+            namespace.get("router")
+            or namespace.get("_alias_router")
+            or namespace.get("include")
         )
         if router_obj is None:
             logger.debug("Module %s has no router attribute; skipping", mod_path)
@@ -267,9 +284,17 @@ def register_routers(app: FastAPI):
 
         app.include_router(router_obj, tags=[tag])
 
-    for category in all_router_categories:
-        for item, tag in category:
-            _resolve_and_include(item, tag)
+    for mod_path, tag in _ROUTERS:
+        _resolve_and_include(mod_path, tag)
+
+    # The Teams bot webhook is built per app rather than exported as a module
+    # router, and only once Bot Framework credentials are configured. The app
+    # lifespan starts and stops its workers and token refreshers.
+    teams_bot = _import_module(f"{_PACKAGE}.integrations.teams_bot")
+    if teams_bot is not None:
+        config = teams_bot.TEAMS_CONFIG
+        if config["app_id"] and config["app_password"]:
+            app.include_router(teams_bot.create_teams_router())
 
 
 # Create a module-level app for compatibility. Tests or callers that need a
@@ -283,25 +308,43 @@ if os.path.exists(static_dir):
     if os.path.exists(assets_dir):
         app.mount("/assets", StaticFiles(directory=assets_dir), name="static-assets")
 
+    # The built SPA does not change while the process runs: index it once so
+    # the fallback resolves paths with a dict lookup, and hand the cached stat
+    # to FileResponse so serving a file does not stat it again.
+    _STATIC_FILES = {
+        os.path.relpath(path, static_dir).replace(os.sep, "/"): (path, os.stat(path))
+        for root, _, names in os.walk(static_dir)
+        for path in (os.path.join(root, name) for name in names)
+    }
+
+    # index.html answers every client-side route: serve it from memory with
+    # an ETag so browsers revalidate with a 304 instead of re-downloading.
+    _INDEX_HTML = None
+    _INDEX_HEADERS = {}
+    if "index.html" in _STATIC_FILES:
+        with open(os.path.join(static_dir, "index.html"), "rb") as f:
+            _INDEX_HTML = f.read()
+        _INDEX_HEADERS = {
+            "ETag": f'"{hashlib.md5(_INDEX_HTML, usedforsecurity=False).hexdigest()}"',
+            "Cache-Control": "no-cache",
+        }
+    _SPA_EXCLUDED_PREFIXES = ("v1/", "docs", "redoc", "metrics", "health")
+
     @app.get("/{path:path}")
     async def serve_spa_fallback(path: str, request: Request):
         # Exclude API routes from SPA fallback
-        if (
-            path.startswith("v1/")
-            or path.startswith("docs")
-            or path.startswith("redoc")
-            or path.startswith("metrics")
-            or path.startswith("health")
-        ):
+        if path.startswith(_SPA_EXCLUDED_PREFIXES):
             return JSONResponse(status_code=404, content={"detail": "Not Found"})
 
-        file_path = os.path.join(static_dir, path)
-        if os.path.isfile(file_path):
-            return FileResponse(file_path)
+        static_file = _STATIC_FILES.get(path)
+        if static_file is not None and path != "index.html":
+            file_path, stat_result = static_file
+            return FileResponse(file_path, stat_result=stat_result)
 
-        index_path = os.path.join(static_dir, "index.html")
-        if os.path.exists(index_path):
-            return FileResponse(index_path)
+        if _INDEX_HTML is not None:
+            if request.headers.get("if-none-match") == _INDEX_HEADERS["ETag"]:
+                return Response(status_code=304, headers=_INDEX_HEADERS)
+            return Response(_INDEX_HTML, media_type="text/html", headers=_INDEX_HEADERS)
 
         return JSONResponse(status_code=404, content={"detail": "Static assets not found"})
 
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, Response
+from pydantic import BaseModel, TypeAdapter
 
 router = APIRouter()
 
@@ -30,10 +30,9 @@ class HackathonRecord(BaseModel):
 
 
 # --- Endpoints ---
-@router.get("/learning/wiki", response_model=List[WikiPage])
-def list_wiki_pages():
-    # Stub: Return sample wiki pages
-    return [
+# Stub: sample wiki pages. The payload is static, so it is serialized once.
+_WIKI_PAGES = TypeAdapter(List[WikiPage]).dump_json(
+    [
         WikiPage(
             page_id="kb-001",
             title="Onboarding Guide",
@@ -47,18 +46,23 @@ def list_wiki_pages():
             last_updated="2026-02-15T11:05:00Z",
         ),
     ]
+)
+
+
+@router.get("/learning/wiki", response_model=List[WikiPage])
+async def list_wiki_pages():
+    return Response(_WIKI_PAGES, media_type="application/json")
 
 
 @router.post("/learning/wiki", response_model=WikiPage)
-def create_wiki_page(page: WikiPage):
+async def create_wiki_page(page: WikiPage):
     # Stub: Simulate wiki page creation
     return page
 
 
-@router.get("/learning/events", response_model=List[LearningEvent])
-def list_learning_events():
-    # Stub: Return sample learning events
-    return [
+# Stub: sample learning events. The payload is static, so it is serialized once.
+_LEARNING_EVENTS = TypeAdapter(List[LearningEvent]).dump_json(
+    [
         LearningEvent(
             event_id="event-001",
             name="AI Hackathon",
@@ -72,18 +76,23 @@ def list_learning_events():
             description="Monthly knowledge sharing session.",
         ),
     ]
+)
+
+
+@router.get("/learning/events", response_model=List[LearningEvent])
+async def list_learning_events():
+    return Response(_LEARNING_EVENTS, media_type="application/json")
 
 
 @router.post("/learning/events", response_model=LearningEvent)
-def schedule_learning_event(event: LearningEvent):
+async def schedule_learning_event(event: LearningEvent):
     # Stub: Simulate event scheduling
     return event
 
 
-@router.get("/learning/hackathons", response_model=List[HackathonRecord])
-def list_hackathons():
-    # Stub: Return sample hackathon records
-    return [
+# Stub: sample hackathon records. The payload is static, so it is serialized once.
+_HACKATHONS = TypeAdapter(List[HackathonRecord]).dump_json(
+    [
         HackathonRecord(
             hackathon_id="hack-001",
             name="AI Hackathon",
@@ -99,4 +108,10 @@ def list_hackathons():
             date="2026-04-01",
         ),
     ]
+)
+
+
+@router.get("/learning/hackathons", response_model=List[HackathonRecord])
+async def list_hackathons():
+    return Response(_HACKATHONS, media_type="application/json")
 
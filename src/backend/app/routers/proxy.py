@@ -8,8 +8,16 @@ from typing import Optional
 from fastapi import APIRouter, Depends, Header
 from sqlmodel import Session
 
+from .. import leaderboard_writer
 from ..dependencies import get_current_user, get_privacy_mode, get_session
-from ..logic import CreditCalculator, LLMProxy, QuotaManager
+from ..logic import (
+    CreditCalculator,
+    EfficiencyScorer,
+    LLMProxy,
+    QuotaManager,
+    RequestLogger,
+    UnitOfWork,
+)
 from ..metrics import (
     llm_request_duration,
     llm_requests_total,
@@ -146,34 +154,42 @@ async def chat_completions(
         response=response,
     )
 
-    # Atomic settlement in the credit ledger
-    qm.deduct_quota(user, actual_cost, source=quota_result.source)
-
-    # Immutable transactional logging
-    from ..logic import RequestLogger
-
-    rl = RequestLogger(session)
     duration_ms = int((time.perf_counter() - start_time) * 1000)
-
     provider = _detect_provider(request.model)
-    log = rl.log_request(
-        user=user,
-        request=request,
-        response=response,
-        cost_credits=actual_cost,
-        quota_source=quota_result.source,
-        strict_privacy=strict_privacy,
-        latency_ms=duration_ms,
-        provider=provider,
-    )
 
-    # Asynchronous gamification updates
-    from ..dependencies import create_background_task
-    from ..logic import EfficiencyScorer
+    # Settlement: ledger deduction and audit log commit together
+    deferred = None
+    with UnitOfWork(session):
+        # Atomic settlement in the credit ledger
+        qm.deduct_quota(user, actual_cost, source=quota_result.source)
+
+        # Immutable transactional logging
+        log = RequestLogger(session).log_request(
+            user=user,
+            request=request,
+            response=response,
+            cost_credits=actual_cost,
+            quota_source=quota_result.source,
+            strict_privacy=strict_privacy,
+            latency_ms=duration_ms,
+            provider=provider,
+        )
 
-    es = EfficiencyScorer(session)
-    create_background_task(es.update_leaderboard(user, log, period_type="daily"))
-    create_background_task(es.update_leaderboard(user, log, period_type="monthly"))
+        # Gamification updates: batched by the background writer when it has
+        # room, otherwise applied here so they settle with the rest
+        if leaderboard_writer.accepting():
+            deferred = leaderboard_writer.LeaderboardDelta.from_log(log)
+        else:
+            es = EfficiencyScorer(session)
+            for period_type in leaderboard_writer.PERIOD_TYPES:
+                es.update_leaderboard(user, log, period_type=period_type)
+
+    # Queued only once the settlement has committed, so a rolled-back
+    # request never reaches the leaderboard
+    if deferred is not None and not leaderboard_writer.submit(deferred):
+        es = EfficiencyScorer(session)
+        for period_type in leaderboard_writer.PERIOD_TYPES:
+            es.update_leaderboard(user, log, period_type=period_type)
 
     # Telemetry dispatch
     provider = _detect_provider(request.model)
@@ -355,13 +355,14 @@ async def get_quota_status(
     from ..logic import QuotaManager
 
     qm = QuotaManager(session)
+    team_pool, vacation_share = qm._get_team_liquidity(user)
 
     return QuotaStatusResponse(
         personal_quota=user.personal_quota,
         used_tokens=user.used_tokens,
         available_quota=user.available_quota,
-        team_pool_available=qm._get_total_team_pool(user),
-        vacation_share_available=qm._get_vacation_share_credits(user),
+        team_pool_available=team_pool,
+        vacation_share_available=vacation_share,
         status=user.status.value,
     )
 
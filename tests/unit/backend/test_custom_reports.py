@@ -0,0 +1,88 @@
+"""
+Tests for the custom report store's Redis fallback.
+"""
+
+import asyncio
+from datetime import UTC, datetime
+
+import redis
+
+from app.routers import custom_reports
+from app.routers.custom_reports import ReportStore
+from app.schemas import CustomReportResponse
+
+
+class BrokenRedis:
+    """A Redis client whose every command fails, as when the server drops."""
+
+    def __getattr__(self, name):
+        async def fail(*args, **kwargs):
+            raise redis.ConnectionError("Connection refused")
+
+        return fail
+
+    def pipeline(self, transaction=True):
+        raise redis.ConnectionError("Connection refused")
+
+
+def _report(name="Monthly spend"):
+    return CustomReportResponse(
+        id="report-1",
+        name=name,
+        description=None,
+        query="SELECT 1",
+        schedule=None,
+        format="csv",
+        recipients=None,
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        last_run=None,
+        status="idle",
+    )
+
+
+class TestReportStoreFallback:
+    """Redis errors are served from process memory instead of failing the call."""
+
+    def test_save_and_get_fall_back_to_memory(self):
+        store = ReportStore(BrokenRedis())
+
+        async def scenario():
+            await store.save(_report())
+            return await store.get("report-1"), await store.list()
+
+        found, listed = asyncio.run(scenario())
+
+        assert found.name == "Monthly spend"
+        assert [r.id for r in listed] == ["report-1"]
+
+    def test_delete_falls_back_to_memory(self):
+        store = ReportStore(BrokenRedis())
+
+        async def scenario():
+            await store.save(_report())
+            await store.delete("report-1")
+            return await store.get("report-1")
+
+        assert asyncio.run(scenario()) is None
+
+
+class TestConnectReportStore:
+    """The Redis probe runs from the lifespan, not at import."""
+
+    def test_redis_disabled_keeps_memory_store(self, monkeypatch):
+        monkeypatch.setattr(custom_reports.settings, "redis_enabled", False)
+        monkeypatch.setattr(custom_reports, "store", ReportStore())
+
+        asyncio.run(custom_reports.connect_report_store())
+
+        assert custom_reports.store._redis is None
+
+    def test_unreachable_redis_keeps_memory_store(self, monkeypatch):
+        monkeypatch.setattr(custom_reports.settings, "redis_enabled", True)
+        monkeypatch.setattr(custom_reports.settings, "redis_host", "127.0.0.1")
+        monkeypatch.setattr(custom_reports.settings, "redis_port", 1)
+        monkeypatch.setattr(custom_reports, "store", ReportStore())
+
+        asyncio.run(custom_reports.connect_report_store())
+
+        assert custom_reports.store._redis is None
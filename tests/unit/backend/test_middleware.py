@@ -170,32 +170,28 @@ class TestEfficiencyScorer:
 
     def test_calculate_efficiency_score(self):
         """Test efficiency score calculation."""
-        from decimal import Decimal
-
         from app.logic import EfficiencyScorer
 
         # Normal case
         score = EfficiencyScorer.calculate_efficiency_score(
             prompt_tokens=1000, completion_tokens=500
         )
-        assert score == Decimal("0.5")
+        assert score == 0.5
 
         # High efficiency (more output than input)
         score = EfficiencyScorer.calculate_efficiency_score(
             prompt_tokens=100, completion_tokens=500
         )
-        assert score == Decimal("5.0")
+        assert score == 5.0
 
         # Zero prompt tokens
         score = EfficiencyScorer.calculate_efficiency_score(prompt_tokens=0, completion_tokens=500)
-        assert score == Decimal("0.00")
+        assert score == 0.0
 
     def test_efficiency_score_rounding(self):
         """Test that efficiency score is properly rounded."""
-        from decimal import Decimal
-
         from app.logic import EfficiencyScorer
 
         score = EfficiencyScorer.calculate_efficiency_score(prompt_tokens=3, completion_tokens=10)
         # Should be rounded to 4 decimal places
-        assert score == Decimal("3.3333")
+        assert score == 3.3333
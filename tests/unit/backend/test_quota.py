@@ -12,8 +12,10 @@ if SRC_BACKEND not in sys.path:
     sys.path.insert(0, SRC_BACKEND)
 
 
+from sqlmodel import select
+
 from app.logic import CreditCalculator, EfficiencyScorer, QuotaManager
-from app.models import ProjectPriority, TeamMemberLink, User, UserStatus
+from app.models import LeaderboardEntry, ProjectPriority, TeamMemberLink, User, UserStatus
 
 
 class TestCreditCalculator:
@@ -152,16 +154,42 @@ class TestEfficiencyScorer:
     def test_calculate_efficiency_score(self):
         """Test efficiency score calculation."""
         score = EfficiencyScorer.calculate_efficiency_score(prompt_tokens=100, completion_tokens=50)
-        assert score == Decimal("0.5000")
+        assert score == 0.5
 
     def test_calculate_efficiency_score_zero_prompt(self):
         """Test efficiency with zero prompt tokens."""
         score = EfficiencyScorer.calculate_efficiency_score(prompt_tokens=0, completion_tokens=50)
-        assert score == Decimal("0.00")
+        assert score == 0.0
 
     def test_calculate_efficiency_high_ratio(self):
         """Test high efficiency ratio."""
         score = EfficiencyScorer.calculate_efficiency_score(
             prompt_tokens=100, completion_tokens=500
         )
-        assert score == Decimal("5.0000")
+        assert score == 5.0
+
+    def test_add_to_leaderboard_upserts_one_row(self, session, test_user):
+        """Repeated adds collapse into one bucket row with summed counters."""
+        scorer = EfficiencyScorer(session)
+        scorer.add_to_leaderboard(test_user.id, "daily", 1, 300, 100, Decimal("0.50"))
+        scorer.add_to_leaderboard(test_user.id, "daily", 2, 300, 100, Decimal("0.25"))
+        session.commit()
+
+        entries = session.exec(
+            select(LeaderboardEntry).where(LeaderboardEntry.user_id == test_user.id)
+        ).all()
+        assert len(entries) == 1
+        entry = entries[0]
+        assert entry.total_requests == 3
+        assert entry.total_prompt_tokens == 600
+        assert entry.total_completion_tokens == 200
+        assert entry.total_cost_credits == Decimal("0.75")
+        assert entry.avg_efficiency_score == Decimal("0.3333")
+
+    def test_add_to_leaderboard_rounds_new_bucket_score(self, session, test_user):
+        """A fresh bucket's score is rounded like an updated one."""
+        entry = EfficiencyScorer(session).add_to_leaderboard(
+            test_user.id, "daily", 1, 3, 2, Decimal("0.01")
+        )
+
+        assert entry.avg_efficiency_score == Decimal("0.6667")
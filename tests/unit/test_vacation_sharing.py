@@ -274,3 +274,27 @@ def test_allocate_vacation_liquidity(session, test_user, test_team):
     result = allocate_vacation_liquidity(session, test_user.id, test_team.id, Decimal("500.00"))
     assert result is True
     assert vacation_user.used_tokens == Decimal("500.00")
+
+
+def test_allocate_zero_vacation_liquidity(session, test_user, test_team):
+    """A zero request succeeds without touching the vacation pool."""
+    from app.logic import allocate_vacation_liquidity
+
+    _, api_key_hash = AuthManager.generate_api_key()
+    vacation_user = User(
+        email="vacation@example.com",
+        name="Vacation User",
+        api_key_hash=api_key_hash,
+        personal_quota=Decimal("1000.00"),
+        used_tokens=Decimal("0.00"),
+        status=UserStatus.ON_VACATION,
+    )
+    session.add(vacation_user)
+    session.commit()
+    session.add(TeamMemberLink(team_id=test_team.id, user_id=vacation_user.id))
+    session.commit()
+
+    result = allocate_vacation_liquidity(session, test_user.id, test_team.id, Decimal("0"))
+    assert result is True
+    session.refresh(vacation_user)
+    assert vacation_user.used_tokens == Decimal("0.00")